@@ -1,9 +1,26 @@
 #!/usr/bin/env python3
 
+import functools
+
 import geopandas as gpd
 import pandas as pd
 from pathlib import Path
 
+@functools.lru_cache(maxsize=2)
+def _read_blocks(path: str) -> gpd.GeoDataFrame:
+    """
+    Read a census blocks shapefile, caching the result so chained calls
+    (e.g. analyze then filter) only parse the file once.
+
+    FIPS code columns are stored as categoricals, so filtering and grouping
+    on them are integer operations. Callers must not modify the returned
+    frame in place.
+    """
+    gdf = gpd.read_file(path, engine="pyogrio")
+    for column in ('STATEFP20', 'COUNTYFP20', 'TRACTCE20'):
+        gdf[column] = gdf[column].astype('category')
+    return gdf
+
 def filter_nyc_census_blocks(input_shapefile="res/tl_2024_36_tabblock20/tl_2024_36_tabblock20.shp",
                            output_shapefile="nyc_census_blocks",
                            output_format="shapefile"):
@@ -29,7 +46,7 @@ def filter_nyc_census_blocks(input_shapefile="res/tl_2024_36_tabblock20/tl_2024_
     print(f"Input: {input_shapefile}")
 
     # Load the full NY state census blocks
-    gdf = gpd.read_file(input_shapefile)
+    gdf = _read_blocks(str(input_shapefile))
 
     print(f"Total NY census blocks loaded: {len(gdf):,}")
     print(f"Coordinate system: {gdf.crs}")
@@ -50,8 +67,9 @@ def filter_nyc_census_blocks(input_shapefile="res/tl_2024_36_tabblock20/tl_2024_
 
     # Show breakdown by borough
     print("\nNYC breakdown by borough:")
+    borough_counts = nyc_gdf['COUNTYFP20'].value_counts()
     for county_fips in sorted(NYC_COUNTIES.keys()):
-        count = len(nyc_gdf[nyc_gdf['COUNTYFP20'] == county_fips])
+        count = borough_counts.get(county_fips, 0)
         print(f"  {county_fips}: {count:,} blocks - {NYC_COUNTIES[county_fips]}")
 
     # Determine output file extension and save
@@ -92,17 +110,18 @@ def analyze_nyc_blocks(input_shapefile="res/tl_2024_36_tabblock20/tl_2024_36_tab
     }
 
     print("Loading and analyzing NYC census blocks...")
-    gdf = gpd.read_file(input_shapefile)
+    gdf = _read_blocks(str(input_shapefile))
     nyc_gdf = gdf[gdf['COUNTYFP20'].isin(NYC_COUNTIES.keys())]
 
     print(f"\nNYC Census Blocks Analysis:")
     print(f"Total blocks: {len(nyc_gdf):,}")
 
-    # Borough breakdown
-    for county_fips in sorted(NYC_COUNTIES.keys()):
-        borough_blocks = nyc_gdf[nyc_gdf['COUNTYFP20'] == county_fips]
-        count = len(borough_blocks)
-        area_km2 = borough_blocks.geometry.area.sum() / 1_000_000
+    # Borough breakdown (areas are computed once, then summed per county)
+    areas = nyc_gdf.geometry.area
+    by_borough = areas.groupby(nyc_gdf['COUNTYFP20'], observed=True).agg(['size', 'sum'])
+    by_borough = by_borough.reindex(sorted(NYC_COUNTIES.keys()), fill_value=0)
+    for county_fips, count, area_sq_meters in by_borough.itertuples():
+        area_km2 = area_sq_meters / 1_000_000
         print(f"  {NYC_COUNTIES[county_fips]}: {count:,} blocks ({area_km2:.1f} km²)")
 
     # Show sample of the data
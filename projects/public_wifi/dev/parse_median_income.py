@@ -69,33 +69,12 @@ def parse_median_income_csv(input_file="data/median-income-2023.csv",
         df['MEDIAN_INCOME'] = df['B19013_001E'].apply(clean_income)
         df['INCOME_MARGIN_ERROR'] = df['B19013_001M'].apply(clean_income)
 
-        # Extract borough/county information from NAME
-        def extract_county_info(name):
-            if pd.isna(name):
-                return 'Unknown', 'Unknown'
-
-            # Extract tract and county from format like "Census Tract 153; Bronx County; New York"
-            parts = str(name).split(';')
-
-            if len(parts) >= 2:
-                tract_part = parts[0].strip()
-                county_part = parts[1].strip()
-
-                # Extract tract number
-                tract_match = re.search(r'Census Tract ([\d.]+)', tract_part)
-                tract_num = tract_match.group(1) if tract_match else 'Unknown'
-
-                # Extract county name
-                county_match = re.search(r'(.+) County', county_part)
-                county_name = county_match.group(1) if county_match else county_part
-
-                return tract_num, county_name
-
-            return 'Unknown', 'Unknown'
-
-        df[['TRACT_NUMBER', 'COUNTY_NAME']] = df['NAME'].apply(
-            lambda x: pd.Series(extract_county_info(x))
+        # Extract tract number and county name from NAME in a single regex pass
+        # Format: "Census Tract 153; Bronx County; New York"
+        extracted = df['NAME'].str.extract(
+            r'Census Tract (?P<TRACT_NUMBER>[\d.]+);\s*(?P<COUNTY_NAME>[^;]+?)\s+County'
         )
+        df[['TRACT_NUMBER', 'COUNTY_NAME']] = extracted.fillna('Unknown')
 
         # Map county names to boroughs for NYC
         COUNTY_TO_BOROUGH = {
@@ -106,7 +85,10 @@ def parse_median_income_csv(input_file="data/median-income-2023.csv",
             'Richmond': 'STATEN ISLAND'   # Richmond County = Staten Island
         }
 
-        df['BOROUGH'] = df['COUNTY_NAME'].map(COUNTY_TO_BOROUGH).fillna('OTHER')
+        df['BOROUGH'] = pd.Categorical(
+            df['COUNTY_NAME'].map(COUNTY_TO_BOROUGH).fillna('OTHER'),
+            categories=list(COUNTY_TO_BOROUGH.values()) + ['OTHER']
+        )
 
         # Filter out records without valid FIPS codes or income data
         valid_records = df[
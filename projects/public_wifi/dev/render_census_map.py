@@ -8,6 +8,62 @@ import numpy as np
 import pandas as pd
 import sys
 
+# Read shapefiles through pyogrio (vectorized OGR reads) rather than Fiona
+gpd.options.io_engine = "pyogrio"
+
+# Artists below this zorder are rasterized when saving to vector formats (PDF/SVG),
+# so the polygon layers become a single image while titles, axes and colorbars stay vector
+RASTER_ZORDER = 1
+
+# FIPS code columns held as categoricals rather than Python strings
+CATEGORICAL_COLUMNS = ('STATEFP20', 'COUNTYFP20', 'TRACTCE20')
+
+# Shapefile attributes used by the renderers; OGR skips materializing the rest
+BLOCK_COLUMNS = ['ALAND20', 'COUNTYFP20', 'TRACTCE20', 'STATEFP20', 'GEOID20', 'geometry']
+
+def _read_blocks(shapefile_path, where=None):
+    """
+    Read a census blocks shapefile with the FIPS code columns cast to categoricals.
+
+    Only BLOCK_COLUMNS are read, via pyogrio's Arrow-backed reader. An optional
+    SQL where clause is evaluated by OGR against the attribute table, so rows
+    it rejects never have their geometry decoded.
+    """
+    gdf = gpd.read_file(shapefile_path, engine="pyogrio", use_arrow=True,
+                        columns=BLOCK_COLUMNS, where=where)
+    for column in CATEGORICAL_COLUMNS:
+        gdf[column] = gdf[column].astype('category')
+    return gdf
+
+def _read_land_blocks(shapefile_path, county_filter=None):
+    """
+    Read the census blocks that are not water only, optionally limited to some counties.
+
+    The first call parses the shapefile and caches every land block in the state as
+    GeoParquet next to it (same name, .parquet suffix). Later calls load the cache
+    instead, with the county filter pushed into the Parquet scan. The cache is
+    rebuilt whenever the shapefile is newer than it.
+    """
+    shapefile_path = Path(shapefile_path)
+    cache_path = shapefile_path.with_suffix('.parquet')
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= shapefile_path.stat().st_mtime:
+        print(f"Loading cached land blocks from {cache_path}...")
+        filters = [('COUNTYFP20', 'in', sorted(county_filter))] if county_filter else None
+        return gpd.read_parquet(cache_path, filters=filters)
+
+    # Water only blocks are dropped by the reader; the cache holds every county
+    # so it can serve any later filter
+    print("Loading census block shapefile (excluding water only blocks)...")
+    gdf = _read_blocks(shapefile_path, where="ALAND20 > 100")
+
+    print(f"Caching land blocks to {cache_path}...")
+    gdf.to_parquet(cache_path)
+
+    if county_filter:
+        gdf = gdf[gdf['COUNTYFP20'].isin(county_filter)].copy()
+    return gdf
+
 def render_census_blocks_map(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_36_tabblock20.shp",
                            output_file="ny_census_blocks_map.png",
                            figsize=(10, 8),
@@ -23,7 +79,8 @@ def render_census_blocks_map(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_3
     Render a map from NY census block shapefiles with optional choropleth coloring.
 
     Args:
-        shapefile_path (str): Path to the shapefile
+        shapefile_path (str): Path to the shapefile (land blocks are cached alongside it
+            as GeoParquet, see _read_land_blocks)
         output_file (str): Output filename for the map
         figsize (tuple): Figure size in inches
         dpi (int): Resolution for output image
@@ -36,29 +93,27 @@ def render_census_blocks_map(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_3
         legend_title (str): Title for the colorbar legend
     """
 
-    print("Loading census block shapefile...")
-    gdf = gpd.read_file(shapefile_path)
+    if county_filter:
+        print(f"Filtering to counties: {county_filter}")
+
+    gdf = _read_land_blocks(shapefile_path, county_filter)
 
     print(f"Loaded {len(gdf)} census blocks")
     print(f"Coordinate system: {gdf.crs}")
 
-    print(f"Filtering out water only blocks...")
-    gdf = gdf[gdf['ALAND20'] > 100]
-    print(f"Filtered to {len(gdf)} census blocks")
-
-    if county_filter:
-        print(f"Filtering to counties: {county_filter}")
-        gdf = gdf[gdf['COUNTYFP20'].isin(county_filter)]
-        print(f"Filtered to {len(gdf)} census blocks")
-
     fig, ax = plt.subplots(figsize=figsize)
+    ax.set_rasterization_zorder(RASTER_ZORDER)
 
     if census_tracts:
         print("Dissolving blocks into census tracts...")
-        gdf = gdf.dissolve(by='TRACTCE20')
+        gdf = gdf.dissolve(by='TRACTCE20', observed=True)
         gdf = gdf.reset_index()
-        # Create full tract FIPS code (state + county + tract)
-        gdf['TRACT_FIPS'] = (gdf['STATEFP20'] + gdf['COUNTYFP20'] + gdf['TRACTCE20']).astype('str')
+        # Create full tract FIPS code (state + county + tract) as an integer:
+        # SS CCC TTTTTT -> state * 10^9 + county * 10^6 + tract
+        state = gdf['STATEFP20'].astype(np.int64)
+        county = gdf['COUNTYFP20'].astype(np.int64)
+        tract = gdf['TRACTCE20'].astype(np.int64)
+        gdf['TRACT_FIPS'] = state * 10**9 + county * 10**6 + tract
         print(f"Created {len(gdf)} census tracts")
 
     # Handle choropleth coloring if data provided
@@ -73,29 +128,26 @@ def render_census_blocks_map(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_3
             # Use block-level FIPS (full GEOID20)
             join_column = 'GEOID20'
 
-        gdf['TRACT_FIPS'] = gdf['TRACT_FIPS'].astype(np.int64)
-        
-        # Merge choropleth data with shapefile
-        gdf_merged = gdf.merge(
-            choropleth_data[[fips_column, value_column]],
-            left_on=join_column,
-            right_on=fips_column,
-            how='left'
-        )
+        # Look up each geometry's value in a FIPS-indexed series (both keys as int64)
+        # rather than merging the two frames
+        lookup = choropleth_data.set_index(fips_column)[value_column]
+        lookup.index = lookup.index.astype(np.int64)
+        gdf[value_column] = gdf[join_column].astype(np.int64).map(lookup)
 
-        # Check merge success
-        matched_count = gdf_merged[value_column].notna().sum()
+        # Check match success
+        matched_count = gdf[value_column].notna().sum()
         print(f"Matched {matched_count} of {len(gdf)} geometries with choropleth data")
 
         # Plot with choropleth coloring
-        gdf_merged.plot(ax=ax,
-                       column=value_column,
-                       cmap=colormap,
-                       edgecolor='white',
-                       linewidth=0.1,
-                       alpha=0.8,
-                       legend=True,
-                       missing_kwds={'color': 'lightgray', 'alpha': 0.5})
+        gdf.plot(ax=ax,
+                 column=value_column,
+                 cmap=colormap,
+                 edgecolor='white',
+                 linewidth=0.1,
+                 alpha=0.8,
+                 legend=True,
+                 missing_kwds={'color': 'lightgray', 'alpha': 0.5},
+                 zorder=0)
 
         # Customize colorbar
         if legend_title:
@@ -107,7 +159,8 @@ def render_census_blocks_map(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_3
                  color='lightblue',
                  edgecolor='white',
                  linewidth=0.1,
-                 alpha=0.7)
+                 alpha=0.7,
+                 zorder=0)
 
     # Set appropriate title based on data type
     if census_tracts:
@@ -140,18 +193,24 @@ def render_county_map(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_36_tabbl
     """
 
     print("Loading census block shapefile for county visualization...")
-    gdf = gpd.read_file(shapefile_path)
+    gdf = _read_blocks(shapefile_path)
 
-    county_gdf = gdf.dissolve(by='COUNTYFP20')
+    # Census blocks tile each county without overlaps, so a coverage union merges them
+    # by dropping shared edges instead of running a full overlay per county
+    county_gdf = gdf[['COUNTYFP20', 'geometry']].dissolve(by='COUNTYFP20', observed=True,
+                                                           method='coverage')
+    county_gdf = county_gdf.reset_index()
 
     fig, ax = plt.subplots(figsize=(20, 16))
+    ax.set_rasterization_zorder(RASTER_ZORDER)
 
     county_gdf.plot(ax=ax,
                     column='COUNTYFP20',
                     cmap='Set3',
                     edgecolor='black',
                     linewidth=0.5,
-                    legend=True)
+                    legend=True,
+                    zorder=0)
 
     ax.set_title('New York Counties from Census Blocks (2024)', fontsize=16, fontweight='bold')
     ax.set_xlabel('Longitude')
@@ -170,9 +229,9 @@ def get_county_info(shapefile_path="res/tl_2024_36_tabblock20/tl_2024_36_tabbloc
     Get information about counties in the shapefile.
     """
     print("Loading shapefile to get county information...")
-    gdf = gpd.read_file(shapefile_path)
+    gdf = _read_blocks(shapefile_path)
 
-    counties = gdf.groupby('COUNTYFP20').agg({
+    counties = gdf.groupby('COUNTYFP20', observed=True).agg({
         'GEOID20': 'count',
         'geometry': lambda x: x.iloc[0]
     }).rename(columns={'GEOID20': 'block_count'})
@@ -190,7 +249,8 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Render maps from NY census block shapefiles")
     parser.add_argument("--shapefile", default="res/tl_2024_36_tabblock20/tl_2024_36_tabblock20.shp",
-                       help="Path to shapefile")
+                       help="Path to shapefile. Land blocks are cached next to it as "
+                            "<shapefile name>.parquet on first render; delete that file to force a re-read")
     parser.add_argument("--output", default="ny_census_blocks_map.png",
                        help="Output filename")
     parser.add_argument("--nyc", action="store_true", help="Filter to only NYC counties")
@@ -1,4 +1,37 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One session per thread, so repeated lookups reuse pooled keep-alive connections instead
+# of paying a TCP+TLS handshake per address, without sharing a Session across threads
+# (requests doesn't promise that is safe). Transient geocoder errors are retried with backoff.
+_thread_local = threading.local()
+
+def _get_session():
+    """Returns this thread's geocoder session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])))
+        _thread_local.session = session
+    return session
+
+# (connect, read) timeouts in seconds for geocoder requests
+GEOCODER_TIMEOUT = (3, 10)
+
+# The batch endpoint accepts at most 10,000 addresses per upload
+BATCH_GEOCODE_LIMIT = 10_000
+BATCH_GEOCODE_TIMEOUT = (3, 600)
+BATCH_RESPONSE_COLUMNS = [
+    'id', 'input_address', 'match', 'match_type', 'matched_address', 'coordinates',
+    'tiger_line_id', 'side', 'state_fips', 'county_fips', 'tract_fips', 'block'
+]
 
 def address_to_fips(street, city, state):
     """
@@ -14,7 +47,7 @@ def address_to_fips(street, city, state):
                       otherwise None.
 
     Raises:
-        requests.RequestException: If the HTTP request fails.
+        requests.RequestException: If the HTTP request fails or returns an error status.
         KeyError: If the expected keys are not found in the API response.
     """
     url = "https://geocoding.geo.census.gov/geocoder/geographies/address"
@@ -27,7 +60,8 @@ def address_to_fips(street, city, state):
         'format': 'json'
     }
 
-    response = requests.get(url, params=params)
+    response = _get_session().get(url, params=params, timeout=GEOCODER_TIMEOUT)
+    response.raise_for_status()
     data = response.json()
 
     if data['result']['addressMatches']:
@@ -37,4 +71,73 @@ def address_to_fips(street, city, state):
             'county_fips': geographies['Counties'][0]['COUNTY'],
             'tract_fips': geographies['Census Tracts'][0]['TRACT']
         }
-    return None
\ No newline at end of file
+    return None
+
+def address_list_to_fips(addresses, max_workers=16):
+    """
+    Geocodes a list of (street, city, state) tuples concurrently with address_to_fips.
+
+    Lookups run on a pool of worker threads, each with its own session. Plain threads
+    (rather than asyncio) keep this usable from inside a running event loop, e.g. Jupyter.
+
+    Args:
+        addresses (list): (street, city, state) tuples.
+        max_workers (int): Maximum number of requests in flight at once.
+
+    Returns:
+        list: One address_to_fips result per address, in input order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda address: address_to_fips(*address), addresses))
+
+def addresses_to_fips(df):
+    """
+    Retrieves FIPS codes for many addresses using the Census batch geocoder.
+
+    Addresses are uploaded as CSV in chunks of up to 10,000, one request per chunk.
+
+    Args:
+        df (pd.DataFrame): Addresses with 'street', 'city' and 'state' columns and an optional 'zip' column.
+
+    Returns:
+        pd.DataFrame: df with 'state_fips', 'county_fips' and 'tract_fips' columns added,
+                      left empty (NaN) for addresses without a match.
+
+    Raises:
+        requests.RequestException: If an upload fails or returns an error status.
+    """
+    url = "https://geocoding.geo.census.gov/geocoder/geographies/addressbatch"
+    data = {
+        'benchmark': 'Public_AR_Current',
+        'vintage': 'Current_Current'
+    }
+
+    addresses = pd.DataFrame({
+        'id': range(len(df)),
+        'street': df['street'].to_numpy(),
+        'city': df['city'].to_numpy(),
+        'state': df['state'].to_numpy(),
+        'zip': df['zip'].to_numpy() if 'zip' in df.columns else ''
+    })
+
+    results = []
+    for start in range(0, len(addresses), BATCH_GEOCODE_LIMIT):
+        chunk = addresses.iloc[start:start + BATCH_GEOCODE_LIMIT]
+        csv_bytes = chunk.to_csv(index=False, header=False).encode('utf-8')
+        response = _get_session().post(url, data=data, files={'addressFile': ('addresses.csv', csv_bytes, 'text/csv')},
+                                       timeout=BATCH_GEOCODE_TIMEOUT)
+        response.raise_for_status()
+        results.append(pd.read_csv(io.StringIO(response.text), header=None, names=BATCH_RESPONSE_COLUMNS, dtype=str))
+
+    fips_columns = ['state_fips', 'county_fips', 'tract_fips']
+    if results:
+        matches = pd.concat(results, ignore_index=True)
+        matches = matches[matches['match'] == 'Match']
+        matches.index = matches['id'].astype(int)
+    else:
+        matches = pd.DataFrame(columns=fips_columns)
+
+    out = df.copy()
+    for column in fips_columns:
+        out[column] = matches[column].reindex(range(len(df))).to_numpy()
+    return out
@@ -3,60 +3,168 @@ import os
 from pathlib import Path
 import csv
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+# Bytes handed to the arrow CSV parser per batch
+ARROW_BLOCK_SIZE = 64 << 20
+
 @click.command()
 @click.argument('input_files', nargs=-1, type=click.Path(exists=True, dir_okay=False))
 @click.option('--output-dir', '-o', required=True, type=click.Path(file_okay=False, writable=True), help='Directory to write normalized files')
-def normalize(input_files, output_dir):
+@click.option('--engine', type=click.Choice(['arrow', 'python']), default='arrow', show_default=True, help='CSV engine: batched pyarrow reads or the row-at-a-time csv module')
+def normalize(input_files, output_dir, engine):
     """
     Normalize a set of INPUT_FILES and write results to OUTPUT_DIR.
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    def partition(record:dict[str]) -> str:
-        date_worked = record["date_worked"]
-        year = date_worked.split("/")[2]
-        return year
+    existing_partitions = set([f.split(".")[0] for f in os.listdir(output_dir)])
+    if engine == 'arrow':
+        num_partitions = _normalize_arrow(input_files, output_dir, existing_partitions)
+    else:
+        num_partitions = _normalize_python(input_files, output_dir, existing_partitions)
+
+    click.echo(f"Normalized {', '.join(input_files)} -> {output_dir}, wrote {num_partitions} partitions")
 
-    def key(record:dict[str]) -> str:
-        return "".join(record.values())
-    
+def _column_order(file_header, part_header, file_path) -> list:
+    # Where each partition file column sits in this input file, None if the file
+    # lacks it. Same rules as the csv.DictWriter these engines replaced: columns
+    # the input lacks are written empty, columns the partition has no place for
+    # are an error.
+    extra = [name for name in file_header if name not in part_header]
+    if extra:
+        raise ValueError(f"{file_path} has columns {extra} not in the partition header {part_header}")
+    positions = {name: i for i, name in enumerate(file_header)}
+    return [positions.get(name) for name in part_header]
+
+def _normalize_python(input_files, output_dir, existing_partitions) -> int:
+    # Plain csv.reader rows (lists) with the date column located once per file,
+    # instead of building a dict per row with DictReader.
     partition_keymap = dict()
+    part_headers = dict()
 
     writers = dict()
     f_handles = []
-    existing_partitions = set([f.split(".")[0] for f in os.listdir(output_dir)])
     try:
         for file_path in input_files:
             input_path = Path(file_path)
             with input_path.open('r') as infile:
-                reader = csv.DictReader(infile)
-                for line in reader:
-                    part = partition(line)
-                    k = key(line)
+                reader = csv.reader(infile)
+                header = next(reader)
+                date_idx = header.index("date_worked")
+                # Rows are written under the header of the file that opened the
+                # partition, so map this file's columns onto it once per partition
+                orders = dict()
+                for row in reader:
+                    if not row:
+                        # DictReader skipped blank lines, keep doing so
+                        continue
+                    part = row[date_idx].split("/")[2]
 
                     if part in existing_partitions:
                         continue
 
                     if part not in partition_keymap:
                         partition_keymap[part] = set()
+                        part_headers[part] = header
                         write_h = open(os.path.join(output_dir, f"{part}.csv"),"w")
                         f_handles.append(write_h)
-                        writer = csv.DictWriter(write_h, reader.fieldnames)
-                        writer.writeheader()
+                        writer = csv.writer(write_h)
+                        writer.writerow(header)
                         writers[part] = writer
 
+                    if part not in orders:
+                        orders[part] = _column_order(header, part_headers[part], file_path)
+                    row = [row[i] if i is not None else "" for i in orders[part]]
+
+                    # 64-bit hash of the row rather than the row text itself, so the
+                    # dedup sets hold one small int per row. The unit separator keeps
+                    # ("ab", "c") and ("a", "bc") distinct. hash() is salted per
+                    # process, which is fine because the keys only live for this run.
+                    k = hash("\x1f".join(row))
 
                     if k in partition_keymap[part]:
                         continue
                     partition_keymap[part].add(k)
 
-                    writers[part].writerow(line)
+                    writers[part].writerow(row)
+    finally:
+        for handle in f_handles:
+            handle.close()
+
+    return len(writers)
+
+def _normalize_arrow(input_files, output_dir, existing_partitions) -> int:
+    # Same partitioning and dedup as the python engine, but a batch at a time:
+    # arrow parses the CSV, splits out the year and joins each row's cells, and
+    # pandas hashes the joined rows to 64-bit ints for the per-year seen sets.
+    # Rows go out through csv.writer rather than pyarrow's CSV writer, which
+    # quotes every string cell and would change the output files.
+    partition_keymap = dict()
+    part_headers = dict()
+    writers = dict()
+    f_handles = []
+    try:
+        for file_path in input_files:
+            with open(file_path, newline='') as infile:
+                header = next(csv.reader(infile))
+            reader = pa_csv.open_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+                # Keep every cell as text so values are written back untouched
+                convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header}))
+            orders = dict()
+
+            for batch in reader:
+                years = pc.list_element(pc.split_pattern(batch.column("date_worked"), "/"), 2)
+                # Columns and row hashes in each partition's header order, built once
+                # per distinct order in the batch (in practice there is only one)
+                reordered = dict()
+
+                for part in pc.unique(years).to_pylist():
+                    if part in existing_partitions:
+                        continue
+
+                    if part not in partition_keymap:
+                        partition_keymap[part] = set()
+                        part_headers[part] = header
+                        write_h = open(os.path.join(output_dir, f"{part}.csv"), "w", newline='')
+                        f_handles.append(write_h)
+                        writer = csv.writer(write_h, lineterminator="\r\n")
+                        writer.writerow(header)
+                        writers[part] = writer
+
+                    if part not in orders:
+                        orders[part] = tuple(_column_order(header, part_headers[part], file_path))
+                    order = orders[part]
+                    if order not in reordered:
+                        columns = [batch.column(i) if i is not None else pa.repeat("", batch.num_rows)
+                                   for i in order]
+                        joined = pc.binary_join_element_wise(*columns, "\x1f")
+                        reordered[order] = (columns, pd.util.hash_array(joined.to_numpy(zero_copy_only=False)))
+                    columns, hashes = reordered[order]
+
+                    seen = partition_keymap[part]
+                    rows = np.flatnonzero(pc.equal(years, part).to_numpy(zero_copy_only=False))
+                    keep = []
+                    for row, k in zip(rows.tolist(), hashes[rows].tolist()):
+                        if k in seen:
+                            continue
+                        seen.add(k)
+                        keep.append(row)
+
+                    if keep:
+                        writers[part].writerows(zip(*(pc.take(column, keep).to_pylist() for column in columns)))
     finally:
         for handle in f_handles:
             handle.close()
 
-    click.echo(f"Normalized {input_path} -> {output_dir}, wrote {len(writers)} partitions")
+    return len(writers)
 
 if __name__ == '__main__':
-    normalize()
\ No newline at end of file
+    normalize()
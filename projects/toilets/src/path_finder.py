@@ -1,22 +1,338 @@
 import csv
-import heapq
+import hashlib
 import json
+import logging
+import multiprocessing
 import os
 import random
+import sys
 import time
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# resource (getrusage) is Unix-only; elsewhere the harness reads memory through psutil
+if sys.platform != "win32":
+    import resource
+
 import geopandas as gpd
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+import numba
 import numpy as np
 import psutil
 import math
+from scipy.spatial import cKDTree
 from sklearn.cluster import KMeans
 
+# Earth's radius in feet (mean radius)
+EARTH_RADIUS_FEET = 20_902_231  # approximately 3,959 miles * 5,280 feet/mile
+
+# Borough names in id order, as stored in PathFinderAlgo._borough_id
+BOROUGHS = ("Staten Island", "Manhattan", "Bronx", "Brooklyn", "Queens")
+STATEN_ISLAND_ID = 0
+
+# Nearest neighbors kept per location is max(MIN_NEIGHBOR_K, 4 * sqrt(N)); walks that
+# run past them fall back to the full distance row
+MIN_NEIGHBOR_K = 64
+
+# Where the harness keeps distance matrices between runs, keyed by location file contents.
+# Bump the version whenever the distance kernel or the neighbor layout changes
+DISTANCE_CACHE_DIR = Path("~/.cache/pathfinder").expanduser()
+DISTANCE_CACHE_VERSION = 1
+
+# Starting points evaluated per parallel batch in find_best_starting_point
+START_BATCH_SIZE = 256
+
+# Cluster count ClusteredPathFinderAlgo routes with unless told otherwise
+DEFAULT_NUM_CLUSTERS = 20
+
+# Below this many locations the clustered start search runs in-process, since spawning
+# workers costs more than it saves. Above it, starts go out in this many chunks per worker
+PARALLEL_MIN_STARTS = 1000
+START_CHUNKS_PER_WORKER = 4
+
+# Starting capacity of the harness's per-step metric columns
+METRICS_INITIAL_CAPACITY = 16
+
+# Progress is logged at INFO, route and data problems at WARNING/ERROR,
+# and the harness's per-step metrics at DEBUG
+logger = logging.getLogger("pathfinder")
+
+
+def _neighbor_count(num_locations: int) -> int:
+    """Nearest neighbors kept per location for a set of num_locations"""
+    return min(num_locations, max(MIN_NEIGHBOR_K, int(4 * math.sqrt(num_locations))))
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _haversine_matrix(lat: np.ndarray, lon: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fills out[i, j] with the Haversine distance in feet between locations i and j.
+
+    lat and lon are in radians. Each pair is computed once and mirrored, and
+    rows are split across threads with no N x N temporaries. fastmath lets
+    the loop vectorize; the float32 output hides the relaxed rounding.
+    """
+    num_locations = lat.shape[0]
+    cos_lat = np.cos(lat)
+    for i in numba.prange(num_locations):
+        out[i, i] = 0.0
+        for j in range(i + 1, num_locations):
+            sin_dlat = math.sin((lat[j] - lat[i]) * 0.5)
+            sin_dlon = math.sin((lon[j] - lon[i]) * 0.5)
+            a = sin_dlat * sin_dlat + cos_lat[i] * cos_lat[j] * sin_dlon * sin_dlon
+            d = 2.0 * EARTH_RADIUS_FEET * math.asin(math.sqrt(min(a, 1.0)))
+            out[i, j] = d
+            out[j, i] = d
+
+
+@numba.njit(cache=True)
+def _greedy_nn(neighbor_idx: np.ndarray, dist: np.ndarray, start: int,
+               borough_id: np.ndarray, staten_id: int, max_length: float = np.inf) -> np.ndarray:
+    """
+    Greedy nearest-neighbor walk over location indices, starting at start.
+
+    Once the walk is in Staten Island (borough_id == staten_id) it only moves
+    to other Staten Island locations until all of them have been visited.
+    Candidates come from the nearest neighbors first; if all of those are
+    taken, the full distance row is scanned instead. The walk stops early,
+    returning a partial path, once its length exceeds max_length.
+
+    Returns:
+        int32 array of visited location indices, in order
+    """
+    num_locations = dist.shape[0]
+    visited = np.zeros(num_locations, np.uint8)
+    path = np.empty(num_locations, np.int32)
+
+    remaining_staten_island = 0
+    for i in range(num_locations):
+        if borough_id[i] == staten_id:
+            remaining_staten_island += 1
+
+    visited[start] = 1
+    if borough_id[start] == staten_id:
+        remaining_staten_island -= 1
+    path[0] = start
+    count = 1
+    current = start
+    length = 0.0
+
+    while count < num_locations:
+        staten_island_only = borough_id[current] == staten_id and remaining_staten_island > 0
+
+        # Walk this location's neighbors (nearest first) to the first allowed unvisited one
+        next_location = -1
+        for j in range(neighbor_idx.shape[1]):
+            k = neighbor_idx[current, j]
+            if not visited[k] and (not staten_island_only or borough_id[k] == staten_id):
+                next_location = k
+                break
+
+        if next_location < 0:
+            # Every kept neighbor is visited, so scan all locations
+            best = np.inf
+            for k in range(num_locations):
+                if (not visited[k] and (not staten_island_only or borough_id[k] == staten_id)
+                        and dist[current, k] < best):
+                    best = dist[current, k]
+                    next_location = k
+
+        if next_location < 0:
+            break
+
+        visited[next_location] = 1
+        if borough_id[next_location] == staten_id:
+            remaining_staten_island -= 1
+        path[count] = next_location
+        count += 1
+        length += dist[current, next_location]
+        current = next_location
+
+        if length > max_length:
+            break
+
+    return path[:count]
+
+
+@numba.njit(parallel=True, cache=True)
+def _tour_lengths(neighbor_idx: np.ndarray, dist: np.ndarray, borough_id: np.ndarray,
+                  staten_id: int, starts: np.ndarray, max_length: float) -> np.ndarray:
+    """
+    Total length in feet of the greedy tour from each of starts.
+
+    Tours are independent and only read the shared arrays, so starts are
+    split across threads. Tours that grow past max_length are abandoned.
+
+    Returns:
+        float64 array of tour lengths, inf for abandoned tours
+    """
+    num_locations = dist.shape[0]
+    lengths = np.empty(starts.shape[0], np.float64)
+    for i in numba.prange(starts.shape[0]):
+        path = _greedy_nn(neighbor_idx, dist, np.int64(starts[i]), borough_id, staten_id, max_length)
+        if path.shape[0] < num_locations:
+            lengths[i] = np.inf
+            continue
+        total = 0.0
+        for j in range(path.shape[0] - 1):
+            total += dist[path[j], path[j + 1]]
+        lengths[i] = total
+    return lengths
+
+
+@numba.njit(cache=True)
+def _two_opt(path: np.ndarray, dist: np.ndarray, is_staten_island: np.ndarray) -> np.ndarray:
+    """
+    2-opt local search over a route of location indices.
+
+    Reverses path[i..j] whenever reconnecting the ends shortens the route, and
+    repeats full sweeps until none does. The first and last stops stay put.
+    Moves that would add a Staten Island/other borough crossing are skipped,
+    so a route that visits Staten Island in one stretch still does.
+
+    Returns:
+        Improved copy of path
+    """
+    path = path.copy()
+    n = path.shape[0]
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 2):
+            for j in range(i + 1, n - 1):
+                a = path[i - 1]
+                b = path[i]
+                c = path[j]
+                d = path[j + 1]
+                delta = (np.float64(dist[a, c]) + dist[b, d]) - (np.float64(dist[a, b]) + dist[c, d])
+                if delta >= -1e-6:
+                    continue
+
+                crossings_before = ((is_staten_island[a] != is_staten_island[b]) +
+                                    (is_staten_island[c] != is_staten_island[d]))
+                crossings_after = ((is_staten_island[a] != is_staten_island[c]) +
+                                   (is_staten_island[b] != is_staten_island[d]))
+                if crossings_after > crossings_before:
+                    continue
+
+                path[i:j + 1] = path[i:j + 1][::-1].copy()
+                improved = True
+
+    return path
+
+
+def check_route_fast(path_idx: np.ndarray, num_locations: int) -> Tuple[bool, Dict[str, np.ndarray]]:
+    """
+    Validates a route given as location indices.
+
+    A route stored as an index path is continuous by construction, so this
+    only has to check that every index in [0, num_locations) appears exactly
+    once and that nothing else does.
+
+    Returns:
+        (is_valid, diagnostics) where diagnostics holds the 'duplicates' indices
+        and their 'duplicate_counts', the 'missing' indices, and any 'extra'
+        indices outside the location set
+    """
+    path_idx = np.asarray(path_idx, dtype=np.int64)
+    in_range = (path_idx >= 0) & (path_idx < num_locations)
+    counts = np.bincount(path_idx[in_range], minlength=num_locations)
+
+    duplicates = np.flatnonzero(counts > 1)
+    diagnostics = {
+        "duplicates": duplicates,
+        "duplicate_counts": counts[duplicates],
+        "missing": np.flatnonzero(counts == 0),
+        "extra": np.unique(path_idx[~in_range]),
+    }
+    is_valid = (len(path_idx) >= 2 and not len(duplicates) and
+                not len(diagnostics["missing"]) and not len(diagnostics["extra"]))
+    return bool(is_valid), diagnostics
+
+
+@numba.njit(cache=True)
+def _or_opt(path: np.ndarray, dist: np.ndarray, is_staten_island: np.ndarray,
+            max_segment: int = 3) -> np.ndarray:
+    """
+    Or-opt local search over a route of location indices.
+
+    Moves runs of 1..max_segment consecutive stops (optionally reversed) to
+    the cheapest other place in the route, repeating full sweeps until no
+    move shortens it. Like _two_opt, the first and last stops stay put and
+    moves that add a Staten Island/other borough crossing are skipped.
+
+    Returns:
+        Improved copy of path
+    """
+    path = path.copy()
+    n = path.shape[0]
+
+    improved = True
+    while improved:
+        improved = False
+        for seg_len in range(1, max_segment + 1):
+            i = 1
+            while i + seg_len < n:
+                prev = path[i - 1]
+                first = path[i]
+                last = path[i + seg_len - 1]
+                nxt = path[i + seg_len]
+                removal_gain = (np.float64(dist[prev, first]) + dist[last, nxt]) - dist[prev, nxt]
+                crossings_removed = ((is_staten_island[prev] != is_staten_island[first]) +
+                                     (is_staten_island[last] != is_staten_island[nxt]))
+                crossings_bridge = is_staten_island[prev] != is_staten_island[nxt]
+
+                best_delta = -1e-6
+                best_j = -1
+                best_reverse = False
+                for j in range(n - 1):
+                    if i - 1 <= j <= i + seg_len - 1:
+                        continue
+                    a = path[j]
+                    b = path[j + 1]
+                    base = np.float64(dist[a, b])
+                    crossings_before = crossings_removed + (is_staten_island[a] != is_staten_island[b])
+
+                    # Insert as-is between a and b
+                    delta = (np.float64(dist[a, first]) + dist[last, b]) - base - removal_gain
+                    if delta < best_delta:
+                        crossings_after = (crossings_bridge + (is_staten_island[a] != is_staten_island[first]) +
+                                           (is_staten_island[last] != is_staten_island[b]))
+                        if crossings_after <= crossings_before:
+                            best_delta = delta
+                            best_j = j
+                            best_reverse = False
+
+                    # Insert reversed between a and b
+                    delta = (np.float64(dist[a, last]) + dist[first, b]) - base - removal_gain
+                    if delta < best_delta:
+                        crossings_after = (crossings_bridge + (is_staten_island[a] != is_staten_island[last]) +
+                                           (is_staten_island[first] != is_staten_island[b]))
+                        if crossings_after <= crossings_before:
+                            best_delta = delta
+                            best_j = j
+                            best_reverse = True
+
+                if best_j >= 0:
+                    segment = path[i:i + seg_len].copy()
+                    if best_reverse:
+                        segment = segment[::-1].copy()
+                    rest = np.concatenate((path[:i], path[i + seg_len:]))
+                    pos = best_j + 1 if best_j < i else best_j - seg_len + 1
+                    path = np.concatenate((rest[:pos], segment, rest[pos:]))
+                    improved = True
+                i += 1
+
+    return path
+
 
 @dataclass(frozen=True)
 class Coordinate:
@@ -39,11 +355,6 @@ class Coordinate:
         Returns:
             Distance in feet
         """
-        import math
-
-        # Earth's radius in feet (mean radius)
-        EARTH_RADIUS_FEET = 20_902_231  # approximately 3,959 miles * 5,280 feet/mile
-
         # Convert degrees to radians
         lat1_rad = math.radians(self.latitude)
         lat2_rad = math.radians(other.latitude)
@@ -74,10 +385,10 @@ class StepMetric:
 class RouteStep:
     """A step in a route between two coordinates"""
 
-    def __init__(self, coor_a: Coordinate, coor_b: Coordinate):
+    def __init__(self, coor_a: Coordinate, coor_b: Coordinate, distance: Optional[float] = None):
         self.coor_a = coor_a
         self.coor_b = coor_b
-        self._distance: Optional[float] = None 
+        self._distance: Optional[float] = distance
 
     @property
     def distance(self) -> float:
@@ -88,22 +399,81 @@ class RouteStep:
 
 @dataclass
 class Route:
-    start:Coordinate
-    end:Coordinate
-    steps:List[RouteStep]
+    """A route through the locations, stored as location indices in visiting order"""
+    locations: List[Coordinate] = field(repr=False)
+    path_idx: np.ndarray  # int32 indices into locations
+    dist: np.ndarray = field(repr=False)  # [N, N] distance matrix the path indexes into
+
+    @property
+    def start(self) -> Coordinate:
+        return self.locations[self.path_idx[0]]
+
+    @property
+    def end(self) -> Coordinate:
+        return self.locations[self.path_idx[-1]]
+
+    @property
+    def num_steps(self) -> int:
+        return max(len(self.path_idx) - 1, 0)
+
+    @cached_property
+    def steps(self) -> List[RouteStep]:
+        """RouteStep objects for each leg of the route, only built when first accessed"""
+        path = self.path_idx.tolist()
+        legs = self.leg_distances().tolist()
+        return [RouteStep(self.locations[a], self.locations[b], d)
+                for a, b, d in zip(path[:-1], path[1:], legs)]
+
+    def leg_distances(self) -> np.ndarray:
+        """Distance of each leg in feet, gathered from the matrix in one indexing pass"""
+        return self.dist[self.path_idx[:-1], self.path_idx[1:]]
 
     def total_distance(self) -> float:
-        return sum([s.distance for s in self.steps])
+        # Sum in float64 so long routes don't lose precision to float32 accumulation
+        return float(np.add.reduce(self.leg_distances(), dtype=np.float64))
+
+@dataclass
+class DistanceMatrix:
+    """Pairwise distances between locations, addressed by location index"""
+    dist: np.ndarray  # [N, N] float32 distances in feet
+    neighbor_idx: np.ndarray  # [N, K] int32, each row's K nearest location indices, nearest first
+
+    def __len__(self) -> int:
+        return len(self.dist)
 
 class PathFinderAlgo(object):
 
     def __init__(self, location_path: Path):
-        self.locations = []
+        lats = []
+        lons = []
         with open(location_path) as handle:
             reader = csv.DictReader(handle)
             for line in reader:
-                self.locations.append(Coordinate(float(line["Latitude"]),
-                                                 float(line["Longitude"])))
+                lats.append(float(line["Latitude"]))
+                lons.append(float(line["Longitude"]))
+
+        # Coordinates are stored as contiguous arrays and everything internal works on
+        # location indices; Coordinate objects are only for the public API (start points,
+        # route endpoints, rendering)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.locations = [Coordinate(lat, lon) for lat, lon in zip(lats, lons)]
+        self._lat_rad = np.radians(self.lats)
+        self._lon_rad = np.radians(self.lons)
+
+        # Borough of each location as an index into BOROUGHS
+        self._borough_id = self._get_borough_ids(self.lats, self.lons)
+        self._loc_to_idx = {c: i for i, c in enumerate(self.locations)}
+
+        # Built on the first calculate_distances() call and shared by later callers
+        self._distances: Optional[DistanceMatrix] = None
+
+    def __getstate__(self) -> dict:
+        # The distance matrix is left out when pickling; process pools send it to
+        # each worker once through their initializer instead
+        state = self.__dict__.copy()
+        state["_distances"] = None
+        return state
 
     def _get_borough(self, coord: Coordinate) -> str:
         """
@@ -145,36 +515,96 @@ class PathFinderAlgo(object):
         else:
             return "Manhattan" if lon > -74.0 else "Brooklyn"
 
-    def calculate_distances(self) -> Dict[Coordinate, List[Tuple[float, Coordinate]]]:
+    @staticmethod
+    def _get_borough_ids(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
         """
-        Returns a Map[Coordinate -> List[(Distance, Coordinate)]]
+        Vectorized _get_borough over arrays of coordinates.
 
-        Each coordinate maps to a sorted list of (distance, coordinate) tuples,
-        sorted by distance (nearest first).
+        Applies the same boundary rules in the same order, returning each
+        location's borough as an int8 index into BOROUGHS.
+        """
+        staten_island, manhattan, bronx, brooklyn, queens = range(len(BOROUGHS))
+        conditions = [
+            (40.49 <= lat) & (lat <= 40.65) & (-74.26 <= lon) & (lon <= -74.05),
+            (40.70 <= lat) & (lat <= 40.88) & (-74.02 <= lon) & (lon <= -73.91),
+            (40.79 <= lat) & (lat <= 40.92) & (-73.93 <= lon) & (lon <= -73.75),
+            (40.57 <= lat) & (lat <= 40.74) & (-74.04 <= lon) & (lon <= -73.83),
+            (40.54 <= lat) & (lat <= 40.80) & (-73.96 <= lon) & (lon <= -73.70),
+            # Default to closest match by latitude
+            lat < 40.65,
+            lat > 40.82,
+        ]
+        choices = [
+            staten_island,
+            manhattan,
+            bronx,
+            brooklyn,
+            queens,
+            np.where(lon < -74.05, staten_island, brooklyn),
+            bronx,
+        ]
+        default = np.where(lon > -74.0, manhattan, brooklyn)
+        return np.select(conditions, choices, default).astype(np.int8)
+
+    def _staten_island_mask(self) -> np.ndarray:
+        """Boolean array marking which locations are in Staten Island"""
+        return self._borough_id == STATEN_ISLAND_ID
+
+    def calculate_distances(self) -> DistanceMatrix:
+        """
+        Returns the distances between every pair of locations.
+
+        Locations are addressed by their index in self.locations. Row i of
+        neighbor_idx lists the k location indices closest to location
+        i (nearest first, starting with i itself), with k growing as
+        max(MIN_NEIGHBOR_K, 4 * sqrt(N)) so larger sets rarely need the
+        full-row fallback. The matrix is computed once per instance; later
+        calls return the same object.
 
         Returns:
-            Dictionary mapping each coordinate to a list of (distance, coordinate)
-            tuples sorted by distance
+            DistanceMatrix with the N x N distances (in feet) and the nearest
+            neighbor indices
         """
-        distance_map = {}
+        if self._distances is not None:
+            return self._distances
+
+        lat = self._lat_rad
+        lon = self._lon_rad
 
-        for coord_a in self.locations:
-            # Build priority queue of distances from coord_a to all others
-            distances = []
+        # Full N x N matrix filled by one compiled pass; float32 is plenty for ranking and summing feet
+        dist = np.empty((len(lat), len(lat)), dtype=np.float32)
+        _haversine_matrix(lat, lon, dist)
 
-            for coord_b in self.locations:
-                if coord_a != coord_b:
-                    distance = coord_a.distance_to(coord_b)
-                    distances.append((distance, coord_b))
+        # Nearest neighbors of each coordinate from a KD-tree over the points placed on the
+        # unit sphere. Chord length grows with great-circle distance, so the ranking matches Haversine
+        xyz = np.column_stack([np.cos(lat) * np.cos(lon),
+                               np.cos(lat) * np.sin(lon),
+                               np.sin(lat)])
+        k = _neighbor_count(len(xyz))
+        _, neighbor_idx = cKDTree(xyz).query(xyz, k=k)
+        neighbor_idx = np.asarray(neighbor_idx, dtype=np.int32).reshape(len(xyz), k)
 
-            # Sort by distance (heapq maintains min-heap property)
-            heapq.heapify(distances)
-            distance_map[coord_a] = distances
+        self._distances = DistanceMatrix(dist=dist, neighbor_idx=neighbor_idx)
+        return self._distances
 
-        return distance_map
+    def set_distances(self, distances: DistanceMatrix) -> None:
+        """
+        Uses a precomputed distance matrix (e.g. loaded from a cache) for later
+        calculate_distances() calls.
+
+        Raises:
+            ValueError: if the matrix doesn't match this instance's locations
+        """
+        num_locations = len(self.locations)
+        k = _neighbor_count(num_locations)
+        if (distances.dist.shape != (num_locations, num_locations) or
+                distances.neighbor_idx.shape != (num_locations, k)):
+            raise ValueError(f"Distance matrix shapes {distances.dist.shape} / {distances.neighbor_idx.shape} "
+                             f"don't match {num_locations} locations with {k} neighbors")
+        self._distances = distances
     
     def calculate_shortest_path(self, starting_point: Coordinate,
-                                distances: Dict[Coordinate, List[Tuple[float, Coordinate]]]) -> Route:
+                                distances: DistanceMatrix) -> Route:
         """
         Returns a path that traverses all of the points in distances map, attempting to minimize
         overall distance using a greedy nearest-neighbor heuristic.
@@ -197,134 +627,90 @@ class PathFinderAlgo(object):
         Returns:
             A Route object containing all locations visited exactly once
         """
-        # Track visited locations
-        visited = set()
-        visited.add(starting_point)
-
-        # Identify all Staten Island locations
-        staten_island_coords = {
-            coord for coord in self.locations
-            if self._get_borough(coord) == "Staten Island"
-        }
-
-        # Track whether we've entered Staten Island
-        in_staten_island = (starting_point in staten_island_coords)
-        staten_island_complete = False
-
-        # Build the route steps
-        steps = []
-        current = starting_point
+        start = self._loc_to_idx[starting_point]
 
         # Visit all locations using nearest neighbor heuristic with Staten Island constraint
-        while len(visited) < len(self.locations):
-            # Get sorted distances for current location
-            nearest_neighbors = distances[current]
-
-            # Determine if we're currently in Staten Island
-            current_borough = self._get_borough(current)
-            in_staten_island = (current_borough == "Staten Island")
-
-            # Check if all Staten Island locations have been visited
-            unvisited_staten_island = staten_island_coords - visited
-            staten_island_complete = (len(unvisited_staten_island) == 0)
-
-            # Find nearest unvisited neighbor
-            next_location = None
-            for dist, coord in nearest_neighbors:
-                if coord not in visited:
-                    coord_borough = self._get_borough(coord)
-
-                    # If in Staten Island and not all SI locations visited,
-                    # only consider Staten Island locations
-                    if in_staten_island and not staten_island_complete:
-                        if coord_borough == "Staten Island":
-                            next_location = coord
-                            break
-                    else:
-                        # Otherwise, take nearest unvisited location
-                        next_location = coord
-                        break
-
-            
-            if next_location is None:
-                # This shouldn't happen if distances map is complete
-                break
-            """
-                print(f"[WARNING] No unvisited neighbor found from {current}")
-                print(f"  Current borough: {current_borough}")
-                print(f"  In Staten Island: {in_staten_island}")
-                print(f"  Staten Island complete: {staten_island_complete}")
-                print(f"  Unvisited SI locations: {len(unvisited_staten_island)}")
-                break
-            """
-
-            # Create step and add to route
-            step = RouteStep(current, next_location)
-            steps.append(step)
+        path = _greedy_nn(distances.neighbor_idx, distances.dist, start, self._borough_id, STATEN_ISLAND_ID)
 
-            # Mark as visited and move to next location
-            visited.add(next_location)
-            current = next_location
-
-        # Create the route
         # End point is the last location visited
-        end_point = current
-
         route = Route(
-            start=starting_point,
-            end=end_point,
-            steps=steps
+            locations=self.locations,
+            path_idx=path,
+            dist=distances.dist
         )
 
         return route
     
+    def improve_route(self, route: Route) -> Route:
+        """
+        Shortens a route with 2-opt and Or-opt local search, alternating until
+        neither finds an improvement.
+
+        The route keeps its start and end points, and keeps the Staten Island
+        invariant of the route it was given.
+
+        Args:
+            route: A route over self.locations
+
+        Returns:
+            A Route visiting the same locations with equal or shorter total distance
+        """
+        is_staten_island = self._staten_island_mask()
+        path = route.path_idx.astype(np.int32)
+        best = route.total_distance()
+        while True:
+            path = _or_opt(_two_opt(path, route.dist, is_staten_island), route.dist, is_staten_island)
+            improved = Route(locations=route.locations, path_idx=path, dist=route.dist)
+            total = improved.total_distance()
+            if total >= best - 1e-6:
+                return improved
+            best = total
+
     def pick_starting_point(self) -> Coordinate:
         return Coordinate(40.587520, -73.795700) # Saved from previous optimization
         # return random.choice(self.locations)
     
-    def find_best_starting_point(self) -> Coordinate:
+    def find_best_starting_point(self, distances: Optional[DistanceMatrix] = None) -> Coordinate:
         """
         Iterates over all coordinates to find the best one to start on
         (based on minimizing the total distance).
 
         This method tries every location as a potential starting point,
         calculates the resulting route, and returns the coordinate that
-        produces the shortest total route distance.
+        produces the shortest total route distance. Starting points are
+        evaluated in parallel.
+
+        Args:
+            distances: Pre-calculated distance matrix; computed (and cached) if not given
 
         Returns:
             The coordinate that produces the shortest route
         """
-        print(f"[OPTIMIZATION] Finding best starting point from {len(self.locations)} locations...")
+        logger.info(f"[OPTIMIZATION] Finding best starting point from {len(self.locations)} locations...")
 
-        # Pre-calculate distance matrix once
-        distances = self.calculate_distances()
+        if distances is None:
+            distances = self.calculate_distances()
 
         best_start = None
         best_distance = float('inf')
 
-        # Try each location as a starting point
-        for i, start_coord in enumerate(self.locations):
-            # Calculate route from this starting point
-            route = self.calculate_shortest_path(start_coord, distances)
-            total_dist = route.total_distance()
-
-            # Track the best route found so far
-            if total_dist < best_distance:
-                best_distance = total_dist
-                best_start = start_coord
-
-            # Progress update every 10% of locations
-            if (i + 1) % max(1, len(self.locations) // 10) == 0:
-                progress = (i + 1) / len(self.locations) * 100
-                print(f"  Progress: {progress:.0f}% ({i+1}/{len(self.locations)}) "
-                      f"- Best so far: {best_distance / 5280:.2f} miles")
+        # Tour lengths are computed in parallel a batch of starts at a time. Each batch
+        # abandons tours as soon as they pass the best length from earlier batches
+        starts = np.arange(len(self.locations), dtype=np.int64)
+        for batch in np.array_split(starts, max(1, len(starts) // START_BATCH_SIZE)):
+            lengths = _tour_lengths(distances.neighbor_idx, distances.dist, self._borough_id,
+                                    STATEN_ISLAND_ID, batch, best_distance)
+            i = int(np.argmin(lengths))
+            if lengths[i] < best_distance:
+                best_distance = float(lengths[i])
+                best_start = self.locations[batch[i]]
 
-        print(f"[OPTIMIZATION] Best starting point found: {best_start}")
-        print(f"[OPTIMIZATION] Best route distance: {best_distance / 5280:.2f} miles")
+        logger.info(f"[OPTIMIZATION] Best starting point found: {best_start}")
+        logger.info(f"[OPTIMIZATION] Best route distance: {best_distance / 5280:.2f} miles")
 
         return best_start
 
-    def check_route(self, route: Route) -> bool:
+    def check_route(self, route: Route, verbose: bool = True) -> bool:
         """
         Verifies that the route is 'good'.
 
@@ -333,91 +719,49 @@ class PathFinderAlgo(object):
 
         Args:
             route: The route to validate
+            verbose: Log the problems found (or a summary when valid)
 
         Returns:
             True if the route is valid, False otherwise
         """
-        is_valid = True
-
-        # Collect all coordinates from the route steps
-        visited_coords = set()
-        all_route_coords = []
-
-        # Extract coordinates from each step
-        for i, step in enumerate(route.steps):
-            if i == 0:
-                # First step: include both start and end
-                all_route_coords.append(step.coor_a)
-                all_route_coords.append(step.coor_b)
-            else:
-                # Subsequent steps: only include the destination
-                all_route_coords.append(step.coor_b)
+        is_valid, diagnostics = check_route_fast(route.path_idx, len(self.locations))
+        if not verbose:
+            return is_valid
 
         # Check for duplicates
-        for coord in all_route_coords:
-            if coord in visited_coords:
-                print(f"[ROUTE ERROR] Duplicate coordinate found in route: {coord}")
-                is_valid = False
-            visited_coords.add(coord)
-
-        # Check if route contains all locations
-        expected_locations = set(self.locations)
+        for idx, count in zip(diagnostics["duplicates"], diagnostics["duplicate_counts"]):
+            logger.error(f"[ROUTE ERROR] Duplicate coordinate found in route: {self.locations[idx]} "
+                         f"({count} times)")
 
         # Check for missing locations
-        missing_locations = expected_locations - visited_coords
-        if missing_locations:
-            print(f"[ROUTE ERROR] Route is missing {len(missing_locations)} location(s):")
-            for coord in list(missing_locations)[:5]:  # Show first 5
-                print(f"  - {coord}")
+        missing_locations = diagnostics["missing"]
+        if len(missing_locations):
+            logger.error(f"[ROUTE ERROR] Route is missing {len(missing_locations)} location(s):")
+            for idx in missing_locations[:5]:  # Show first 5
+                logger.error(f"  - {self.locations[idx]}")
             if len(missing_locations) > 5:
-                print(f"  ... and {len(missing_locations) - 5} more")
-            is_valid = False
+                logger.error(f"  ... and {len(missing_locations) - 5} more")
 
         # Check for extra locations not in the original set
-        extra_locations = visited_coords - expected_locations
-        if extra_locations:
-            print(f"[ROUTE ERROR] Route contains {len(extra_locations)} extra location(s) not in original set:")
-            for coord in list(extra_locations)[:5]:  # Show first 5
-                print(f"  - {coord}")
-            if len(extra_locations) > 5:
-                print(f"  ... and {len(extra_locations) - 5} more")
-            is_valid = False
-
-        # Check route continuity (each step's end matches next step's start)
-        for i in range(len(route.steps) - 1):
-            current_end = route.steps[i].coor_b
-            next_start = route.steps[i + 1].coor_a
-            if current_end != next_start:
-                print(f"[ROUTE ERROR] Route discontinuity at step {i}->{i+1}:")
-                print(f"  Step {i} ends at:   {current_end}")
-                print(f"  Step {i+1} starts at: {next_start}")
-                is_valid = False
-
-        # Check start and end coordinates match route.start and route.end
-        if route.steps:
-            if route.steps[0].coor_a != route.start:
-                print(f"[ROUTE ERROR] Route start mismatch:")
-                print(f"  Expected: {route.start}")
-                print(f"  Actual:   {route.steps[0].coor_a}")
-                is_valid = False
-
-            if route.steps[-1].coor_b != route.end:
-                print(f"[ROUTE ERROR] Route end mismatch:")
-                print(f"  Expected: {route.end}")
-                print(f"  Actual:   {route.steps[-1].coor_b}")
-                is_valid = False
-        else:
-            print(f"[ROUTE ERROR] Route has no steps")
-            is_valid = False
+        extra_indices = diagnostics["extra"]
+        if len(extra_indices):
+            logger.error(f"[ROUTE ERROR] Route contains {len(extra_indices)} extra location(s) not in original set:")
+            for idx in extra_indices[:5]:  # Show first 5
+                logger.error(f"  - index {idx}")
+            if len(extra_indices) > 5:
+                logger.error(f"  ... and {len(extra_indices) - 5} more")
+
+        if len(route.path_idx) < 2:
+            logger.error(f"[ROUTE ERROR] Route has no steps")
 
         # Log success if valid
         if is_valid:
-            print(f"[ROUTE OK] Route is valid:")
-            print(f"  - Contains all {len(self.locations)} locations")
-            print(f"  - No duplicates")
-            print(f"  - No extra locations")
-            print(f"  - Continuous path")
-            print(f"  - Total distance: {route.total_distance():,.2f} feet")
+            logger.info(f"[ROUTE OK] Route is valid:")
+            logger.info(f"  - Contains all {len(self.locations)} locations")
+            logger.info(f"  - No duplicates")
+            logger.info(f"  - No extra locations")
+            logger.info(f"  - Continuous path")
+            logger.info(f"  - Total distance: {route.total_distance():,.2f} feet")
 
         return is_valid
 
@@ -426,6 +770,35 @@ class PathRenderer(object):
     def __init__(self, render_boroughs = True):
         self.render_boroughs = render_boroughs
 
+    @cached_property
+    def boroughs(self) -> Optional[gpd.GeoDataFrame]:
+        """
+        NYC borough boundaries reprojected to WGS84, or None if they can't be loaded.
+
+        Reading and reprojecting the shapefile dominates a render, so it is done
+        once per renderer and reused for later routes.
+        """
+        # Load NYC borough boundaries
+        borough_shapefile = Path(__file__).parent.parent / "data" / "ext_data" / "nybb_25c" / "nybb.shp"
+        try:
+            boroughs = gpd.read_file(borough_shapefile)
+
+            # Reproject from State Plane (NAD 1983 FIPS 3104 feet) to WGS84 (lat/lon)
+            # The shapefile uses EPSG:2263 (NAD83 / New York Long Island)
+            if boroughs.crs is None:
+                logger.warning(f"[WARNING] Borough shapefile has no CRS, assuming EPSG:2263")
+                boroughs = boroughs.set_crs("EPSG:2263")
+
+            # Convert to WGS84 (EPSG:4326) for lat/lon coordinates
+            boroughs = boroughs.to_crs("EPSG:4326")
+
+            logger.info(f"✓ Loaded {len(boroughs)} NYC borough boundaries")
+            logger.info(f"  Reprojected from {boroughs.crs.name if boroughs.crs else 'unknown'} to WGS84")
+            return boroughs
+        except Exception as e:
+            logger.warning(f"[WARNING] Could not load borough boundaries: {e}")
+            return None
+
     def render_route(self, route: Route, output_dir: Path) -> str:
         """
         Renders an image of the route and stores it in the
@@ -449,56 +822,29 @@ class PathRenderer(object):
         fig, ax = plt.subplots(figsize=(16, 12))
 
         if self.render_boroughs:
-            # Load NYC borough boundaries
-            borough_shapefile = Path(__file__).parent.parent / "data" / "ext_data" / "nybb_25c" / "nybb.shp"
-            try:
-                boroughs = gpd.read_file(borough_shapefile)
-
-                # Reproject from State Plane (NAD 1983 FIPS 3104 feet) to WGS84 (lat/lon)
-                # The shapefile uses EPSG:2263 (NAD83 / New York Long Island)
-                if boroughs.crs is None:
-                    print(f"[WARNING] Borough shapefile has no CRS, assuming EPSG:2263")
-                    boroughs = boroughs.set_crs("EPSG:2263")
-
-                # Convert to WGS84 (EPSG:4326) for lat/lon coordinates
-                boroughs = boroughs.to_crs("EPSG:4326")
-
-                has_boroughs = True
-                print(f"✓ Loaded {len(boroughs)} NYC borough boundaries")
-                print(f"  Reprojected from {boroughs.crs.name if boroughs.crs else 'unknown'} to WGS84")
-            except Exception as e:
-                print(f"[WARNING] Could not load borough boundaries: {e}")
-                has_boroughs = False
-
             # Draw borough boundaries first (as background)
-            if has_boroughs:
+            boroughs = self.boroughs
+            if boroughs is not None:
                 boroughs.boundary.plot(ax=ax, linewidth=2.5, edgecolor='lightgray', alpha=0.6, zorder=0)
 
-        # Extract coordinates from route steps
-        lats = []
-        lons = []
-        for i, step in enumerate(route.steps):
-            if i == 0:
-                # First step: add both start and end
-                lats.append(step.coor_a.latitude)
-                lons.append(step.coor_a.longitude)
-            lats.append(step.coor_b.latitude)
-            lons.append(step.coor_b.longitude)
+        # Extract coordinates of each stop, in route order
+        lons = np.array([c.longitude for c in route.locations])[route.path_idx]
+        lats = np.array([c.latitude for c in route.locations])[route.path_idx]
 
         # Generate rainbow colors for edges
-        num_steps = len(route.steps)
+        num_steps = route.num_steps
         colors = plt.cm.rainbow(np.linspace(0, 1, num_steps))
 
-        # Draw edges with rainbow colors
-        for i, step in enumerate(route.steps):
-            ax.plot(
-                [step.coor_a.longitude, step.coor_b.longitude],
-                [step.coor_a.latitude, step.coor_b.latitude],
-                color=colors[i],
-                linewidth=1.5,
-                alpha=0.7,
-                zorder=2
-            )
+        # Draw all edges with rainbow colors as a single collection
+        points = np.column_stack([lons, lats])
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        ax.add_collection(LineCollection(
+            segments,
+            colors=colors,
+            linewidths=1.5,
+            alpha=0.7,
+            zorder=2
+        ))
 
         # Plot all points
         ax.scatter(lons, lats, c='black', s=20, alpha=0.6, zorder=3, label='Locations')
@@ -532,7 +878,7 @@ class PathRenderer(object):
         ax.set_xlabel('Longitude', fontsize=12, fontweight='bold')
         ax.set_ylabel('Latitude', fontsize=12, fontweight='bold')
         ax.set_title(
-            f'Route Visualization of NYC Toilet Run\n{len(route.steps)} steps, '
+            f'Route Visualization of NYC Toilet Run\n{route.num_steps} steps, '
             f'{route.total_distance() / 5280:.2f} miles total',
             fontsize=14,
             fontweight='bold'
@@ -556,13 +902,43 @@ class PathRenderer(object):
         plt.savefig(output_file, dpi=150, bbox_inches='tight')
         plt.close(fig)
 
-        print(f"✓ Route visualization saved to: {output_file}")
+        logger.info(f"✓ Route visualization saved to: {output_file}")
 
         return str(output_file)
 
 
+@lru_cache(maxsize=1)
+def _get_renderer() -> PathRenderer:
+    """Shared renderer, so borough boundaries are loaded once per process"""
+    return PathRenderer()
+
+
 class ClusteredPathFinderAlgo(PathFinderAlgo):
 
+    def __init__(self, location_path: Path):
+        super().__init__(location_path)
+
+        # Coordinates in the [lat, lon] layout KMeans is fit on
+        self._coord_array = np.column_stack([self.lats, self.lons])
+
+        # num_clusters -> (fitted KMeans, int16 cluster id per location index,
+        #                  centroid latitudes in radians, centroid longitudes in radians)
+        self._kmeans_cache: Dict[int, Tuple[KMeans, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _get_clustering(self, num_clusters: int) -> Tuple[KMeans, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the KMeans clustering of the locations for num_clusters.
+
+        The clustering does not depend on the starting point, so it is fit once
+        per cluster count and reused.
+        """
+        if num_clusters not in self._kmeans_cache:
+            kmeans = KMeans(n_clusters=min(num_clusters, len(self.locations)), random_state=42)
+            cluster_of = kmeans.fit_predict(self._coord_array).astype(np.int16)
+            centroids = np.radians(kmeans.cluster_centers_)
+            self._kmeans_cache[num_clusters] = (kmeans, cluster_of, centroids[:, 0], centroids[:, 1])
+        return self._kmeans_cache[num_clusters]
+
     def pick_starting_point(self):
         return Coordinate(40.573670, -73.992700) # from optimization run with 20 clusters
 
@@ -574,277 +950,503 @@ class ClusteredPathFinderAlgo(PathFinderAlgo):
         Returns:
             The coordinate that produces the shortest route
         """
-        print(f"[OPTIMIZATION] Finding best starting point and number of clusters point from {len(self.locations)} locations...")
+        logger.info(f"[OPTIMIZATION] Finding best starting point and number of clusters point from {len(self.locations)} locations...")
 
-        # Pre-calculate distance matrix once
+        # Build the shared distance matrix before it is shipped to worker processes
         distances = self.calculate_distances()
 
         best_start = None
         best_distance = float('inf')
         best_cluster_size = None
-        total_search_space = max(1, len(self.locations)) * max_clusters
-
-        num_steps = 0
-        for n in range(1, max_clusters):
-            # Try each location as a starting point
-            for i, start_coord in enumerate(self.locations):
-                # Calculate route from this starting point
-                route = self.calculate_shortest_path(start_coord, distances, {"num_clusters":n})
-                total_dist = route.total_distance()
 
+        # One task per cluster size; each worker tries every start for its size. Tasks only
+        # carry the size, as workers received the algo and matrix once when they started
+        cluster_sizes = list(range(1, max_clusters))
+        with self._worker_pool(distances) as executor:
+            results = executor.map(_worker_best_start_for_clusters, cluster_sizes)
+            for num_done, (n, (total_dist, start_coord)) in enumerate(zip(cluster_sizes, results), start=1):
                 # Track the best route found so far
                 if total_dist < best_distance:
                     best_distance = total_dist
                     best_start = start_coord
                     best_cluster_size = n
 
-                # Progress update every 5% of progress
-                num_steps += 1
-                if num_steps % 5 == 0:
-                    progress = (num_steps / total_search_space*1.0) * 100
-                    print(f"  Progress: {progress:.0f}% ({num_steps}/{total_search_space}) "
-                        f"- Best so far: {best_distance / 5280:.2f} miles")
+                progress = num_done / len(cluster_sizes) * 100
+                logger.info(f"  Progress: {progress:.0f}% ({num_done}/{len(cluster_sizes)} cluster sizes) "
+                            f"- Best so far: {best_distance / 5280:.2f} miles")
 
-        print(f"[OPTIMIZATION] Best starting point found: {best_start}")
-        print(f"[OPTIMIZATION] Best cluster size: {best_cluster_size} clusters")
-        print(f"[OPTIMIZATION] Best route distance: {best_distance / 5280:.2f} miles")
+        logger.info(f"[OPTIMIZATION] Best starting point found: {best_start}")
+        logger.info(f"[OPTIMIZATION] Best cluster size: {best_cluster_size} clusters")
+        logger.info(f"[OPTIMIZATION] Best route distance: {best_distance / 5280:.2f} miles")
 
         return best_start
 
 
-    def _find_nearest_point(self, 
-                            point:Coordinate, 
-                            points:List[Coordinate], 
-                            visited:set[Coordinate], 
-                            distances) -> Coordinate:
-        # Get sorted distances for current location
-        nearest_neighbors = [x for x in distances[point] if x[1] in points]
-        # Find nearest unvisited neighbor
-        next_location = None
-        for dist, coord in nearest_neighbors:
-            if coord not in visited:
-                next_location = coord
-                break
-        return next_location
-
-    def calculate_shortest_path(self, starting_point, distances, params={"num_clusters":20}) -> Route:
+    def find_best_starting_point(self, distances: Optional[DistanceMatrix] = None,
+                                 max_workers: Optional[int] = None) -> Coordinate:
         """
-        Returns a path that traverses all points using clustering to group nearby locations.
+        Iterates over all coordinates to find the best one to start on
+        (based on minimizing the total distance).
 
-        This algorithm:
-        1. Uses KMeans to cluster locations into groups
-        2. Traverses clusters intelligently based on nearest cluster centroid
-        3. Within each cluster, uses nearest neighbor heuristic
-        4. Maintains Staten Island invariant: once entering Staten Island, visits all SI locations
-           before leaving to another borough
+        Each start is scored with the clustered route calculate_shortest_path
+        builds, not the base class's greedy tour, so the start returned is the
+        best one for the route that is actually produced. Starts are split into
+        chunks scored on worker processes, which each receive the algo and the
+        distance matrix once.
 
         Args:
-            starting_point: The coordinate to start the route from
-            distances: Pre-calculated distance matrix
-            params: Dictionary with optional 'num_clusters' parameter
+            distances: Pre-calculated distance matrix; computed (and cached) if not given
+            max_workers: Worker processes to use; defaults to one per CPU, or to scoring
+                         in-process on one CPU or for fewer than PARALLEL_MIN_STARTS locations
 
         Returns:
-            A Route object containing all locations visited exactly once
+            The coordinate that produces the shortest route
         """
-        num_clusters = 5
-        if "num_clusters" in params:
-            num_clusters = params["num_clusters"]
+        logger.info(f"[OPTIMIZATION] Finding best starting point from {len(self.locations)} locations...")
+
+        if distances is None:
+            distances = self.calculate_distances()
+        num_locations = len(self.locations)
+        if max_workers is None and (num_locations < PARALLEL_MIN_STARTS or (os.cpu_count() or 1) == 1):
+            max_workers = 1
+
+        if max_workers == 1:
+            best_distance, best_start = self._best_start_for_clusters(DEFAULT_NUM_CLUSTERS, distances)
+        else:
+            # Fit the clustering once here so workers don't each refit it
+            self._get_clustering(DEFAULT_NUM_CLUSTERS)
+            num_chunks = (max_workers or os.cpu_count() or 1) * START_CHUNKS_PER_WORKER
+            chunks = np.array_split(np.arange(num_locations), min(num_chunks, num_locations))
+            with self._worker_pool(distances, max_workers) as executor:
+                lengths = np.concatenate(list(executor.map(
+                    _worker_tour_lengths, [DEFAULT_NUM_CLUSTERS] * len(chunks), chunks)))
+
+            best = int(np.argmin(lengths))
+            best_distance = float(lengths[best])
+            best_start = self.locations[best] if np.isfinite(best_distance) else None
+
+        logger.info(f"[OPTIMIZATION] Best starting point found: {best_start}")
+        logger.info(f"[OPTIMIZATION] Best route distance: {best_distance / 5280:.2f} miles")
+
+        return best_start
+
+    def _best_start_for_clusters(self, num_clusters: int,
+                                 distances: Optional[DistanceMatrix] = None) -> Tuple[float, Coordinate]:
+        """Shortest route distance and its start point over every start, for one cluster size"""
+        if distances is None:
+            distances = self.calculate_distances()
+        lengths = self._clustered_tour_lengths(np.arange(len(self.locations)), distances, num_clusters)
+        best = int(np.argmin(lengths))
+        if not np.isfinite(lengths[best]):
+            return float('inf'), None
+        return float(lengths[best]), self.locations[best]
+
+    def _clustered_tour_lengths(self, starts: np.ndarray, distances: DistanceMatrix, num_clusters: int) -> np.ndarray:
+        """
+        Total length in feet of the clustered tour from each of starts.
+
+        Walks are abandoned once they pass the shortest tour found so far
+        among these starts.
+
+        Returns:
+            float64 array of tour lengths, inf for abandoned tours
+        """
+        self._get_clustering(num_clusters)
+        lengths = np.full(len(starts), np.inf)
+        best_distance = np.inf
+        for i, start in enumerate(starts):
+            path = self._clustered_walk(int(start), distances, num_clusters, best_distance)
+            if len(path) < len(self.locations):
+                continue
+            lengths[i] = Route(locations=self.locations, path_idx=path, dist=distances.dist).total_distance()
+            best_distance = min(best_distance, lengths[i])
+        return lengths
+
+    @contextmanager
+    def _worker_pool(self, distances: DistanceMatrix, max_workers: Optional[int] = None):
+        """
+        A process pool whose workers each get this algo and distances once, through
+        the pool initializer, rather than with every task.
+
+        Workers are spawned rather than forked, since forking after Numba's thread
+        pool has started hangs.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker, initargs=(self, distances)) as executor:
+            yield executor
+
+    def _find_nearest_point(self,
+                            point: int,
+                            candidates: np.ndarray,
+                            distances: DistanceMatrix) -> int:
+        """
+        Returns the index of the location nearest to point among candidates,
+        a boolean mask over location indices, or -1 if there are none.
+        """
+        # Walk this location's neighbors, nearest first
+        for j in distances.neighbor_idx[point]:
+            if candidates[j]:
+                return int(j)
+
+        # Past the kept neighbors, fall back to the full distance row
+        if not candidates.any():
+            return -1
+        return int(np.argmin(np.where(candidates, distances.dist[point], np.inf)))
+
+    def _clustered_walk(self, start: int, distances: DistanceMatrix, num_clusters: int,
+                        max_length: float = np.inf) -> np.ndarray:
+        """
+        The clustered nearest-neighbor walk behind calculate_shortest_path, over location indices.
+
+        The walk stops early, returning a partial path, once its length exceeds
+        max_length, so start searches can drop tours that can't beat their best.
+
+        Returns:
+            int32 array of visited location indices, in order
+        """
+        num_locations = len(self.locations)
 
         # Identify Staten Island locations
-        staten_island_coords = {
-            coord for coord in self.locations
-            if self._get_borough(coord) == "Staten Island"
-        }
-
-        # Prepare data for clustering: convert coordinates to numpy array
-        coord_array = np.array([[c.latitude, c.longitude] for c in self.locations])
-
-        # Perform KMeans clustering
-        kmeans = KMeans(n_clusters=min(num_clusters, len(self.locations)), random_state=42)
-        cluster_labels = kmeans.fit_predict(coord_array)
-
-        # Build cluster mapping: cluster_id -> list of coordinates
-        clusters = {}
-        for coord, label in zip(self.locations, cluster_labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(coord)
-
-        # Track visited locations and route steps
-        visited = set()
-        visited.add(starting_point)
-        steps = []
-        current = starting_point
+        is_staten_island = self._staten_island_mask()
+
+        # KMeans clustering, fit once per cluster count
+        kmeans, cluster_of, centroid_lat, centroid_lon = self._get_clustering(num_clusters)
+
+        # Track visited locations as a byte per location index, plus how many
+        # unvisited locations remain in Staten Island and in each cluster
+        visited = np.zeros(num_locations, dtype=np.uint8)
+        remaining_in_cluster = np.bincount(cluster_of, minlength=len(kmeans.cluster_centers_))
+        remaining_staten_island = int(is_staten_island.sum())
+
+        def visit(idx):
+            nonlocal remaining_staten_island
+            visited[idx] = 1
+            remaining_in_cluster[cluster_of[idx]] -= 1
+            if is_staten_island[idx]:
+                remaining_staten_island -= 1
+
+        visit(start)
+        path = [start]
+        current = start
+        length = 0.0
 
         # Determine which cluster the starting point belongs to
-        current_cluster_id = cluster_labels[self.locations.index(starting_point)]
+        current_cluster_id = cluster_of[start]
         visited_clusters = {current_cluster_id}
 
-        # Helper function to find nearest unvisited point within a set of candidates
-        def find_nearest_unvisited(from_point, candidates):
-            """Find the nearest unvisited point from candidates"""
-            nearest_neighbors = distances[from_point]
-            for dist, coord in nearest_neighbors:
-                if coord in candidates and coord not in visited:
-                    return coord
-            return None
-
         # Helper function to find nearest cluster centroid
         def find_nearest_cluster(from_point, available_cluster_ids):
-            """Find the cluster with nearest centroid to from_point"""
-            if not available_cluster_ids:
+            """Find the cluster with nearest centroid to location index from_point"""
+            if len(available_cluster_ids) == 0:
                 return None
 
-            min_dist = float('inf')
-            nearest_cluster = None
-
-            for cluster_id in available_cluster_ids:
-                # Calculate distance to cluster centroid
-                centroid = kmeans.cluster_centers_[cluster_id]
-                centroid_coord = Coordinate(centroid[0], centroid[1])
-                dist = from_point.distance_to(centroid_coord)
-
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest_cluster = cluster_id
-
-            return nearest_cluster
+            # Haversine from from_point to every available centroid at once. The
+            # Earth's radius and the outer 2 * asin don't change the ordering
+            lat = self._lat_rad[from_point]
+            lon = self._lon_rad[from_point]
+            c_lat = centroid_lat[available_cluster_ids]
+            c_lon = centroid_lon[available_cluster_ids]
+            a = (np.sin((c_lat - lat) / 2) ** 2 +
+                 np.cos(lat) * np.cos(c_lat) * np.sin((c_lon - lon) / 2) ** 2)
+            return available_cluster_ids[int(np.argmin(a))]
 
         # Main traversal loop
-        while len(visited) < len(self.locations):
-            current_borough = self._get_borough(current)
-            in_staten_island = (current_borough == "Staten Island")
-            unvisited_staten_island = staten_island_coords - visited
-            staten_island_complete = (len(unvisited_staten_island) == 0)
+        while len(path) < num_locations:
+            unvisited = visited == 0
 
             # Determine candidate points for next move
-            if in_staten_island and not staten_island_complete:
+            if is_staten_island[current] and remaining_staten_island > 0:
                 # STATEN ISLAND INVARIANT: Must complete all SI locations before leaving
-                candidates = unvisited_staten_island
+                candidates = unvisited & is_staten_island
             else:
-                # Find unvisited locations in current cluster first
-                current_cluster_unvisited = [
-                    coord for coord in clusters[current_cluster_id]
-                    if coord not in visited
-                ]
-
-                if current_cluster_unvisited:
-                    # Stay in current cluster
-                    candidates = set(current_cluster_unvisited)
-                else:
+                if remaining_in_cluster[current_cluster_id] == 0:
                     # Current cluster complete, move to nearest unvisited cluster
-                    unvisited_cluster_ids = set()
-                    for cluster_id, coords in clusters.items():
-                        if any(coord not in visited for coord in coords):
-                            unvisited_cluster_ids.add(cluster_id)
-
-                    if unvisited_cluster_ids:
-                        # Find nearest cluster
-                        current_cluster_id = find_nearest_cluster(current, unvisited_cluster_ids)
-                        visited_clusters.add(current_cluster_id)
-                        candidates = set([c for c in clusters[current_cluster_id] if c not in visited])
-                    else:
-                        # No more clusters (shouldn't happen)
-                        candidates = set([c for c in self.locations if c not in visited])
+                    unvisited_cluster_ids = np.flatnonzero(remaining_in_cluster > 0)
+                    current_cluster_id = find_nearest_cluster(current, unvisited_cluster_ids)
+                    visited_clusters.add(current_cluster_id)
+
+                # Unvisited locations in the current cluster
+                candidates = unvisited & (cluster_of == current_cluster_id)
 
             # Find nearest unvisited point from candidates
-            next_location = find_nearest_unvisited(current, candidates)
+            next_location = self._find_nearest_point(current, candidates, distances)
 
-            if next_location is None:
+            if next_location < 0:
                 # Fallback: find any unvisited location
-                next_location = find_nearest_unvisited(current, set(self.locations) - visited)
+                next_location = self._find_nearest_point(current, unvisited, distances)
 
-            if next_location is None:
+            if next_location < 0:
                 # Should not happen if distances map is complete
                 break
 
-            # Create step and add to route
-            step = RouteStep(current, next_location)
-            steps.append(step)
+            # Add to route
+            path.append(next_location)
+            length += distances.dist[current, next_location]
 
             # Update state
-            visited.add(next_location)
+            visit(next_location)
             current = next_location
 
             # Update current cluster if we moved to a different one
-            if next_location in self.locations:
-                current_cluster_id = cluster_labels[self.locations.index(next_location)]
+            current_cluster_id = cluster_of[next_location]
+
+            # Give up on walks that can no longer beat max_length
+            if length > max_length:
+                break
+
+        return np.array(path, dtype=np.int32)
+
+    def calculate_shortest_path(self, starting_point, distances, params={"num_clusters": DEFAULT_NUM_CLUSTERS}) -> Route:
+        """
+        Returns a path that traverses all points using clustering to group nearby locations.
+
+        This algorithm:
+        1. Uses KMeans to cluster locations into groups
+        2. Traverses clusters intelligently based on nearest cluster centroid
+        3. Within each cluster, uses nearest neighbor heuristic
+        4. Maintains Staten Island invariant: once entering Staten Island, visits all SI locations
+           before leaving to another borough
+
+        Args:
+            starting_point: The coordinate to start the route from
+            distances: Pre-calculated distance matrix
+            params: Dictionary with optional 'num_clusters' parameter
+
+        Returns:
+            A Route object containing all locations visited exactly once
+        """
+        num_clusters = 5
+        if "num_clusters" in params:
+            num_clusters = params["num_clusters"]
+
+        path = self._clustered_walk(self._loc_to_idx[starting_point], distances, num_clusters)
 
         # Create and return the route
         route = Route(
-            start=starting_point,
-            end=current,
-            steps=steps
+            locations=self.locations,
+            path_idx=path,
+            dist=distances.dist
         )
 
         return route
 
 
+# The algo each spawned worker process received through _init_worker
+_worker_algo: Optional[ClusteredPathFinderAlgo] = None
+
+
+def _init_worker(algo: ClusteredPathFinderAlgo, distances: DistanceMatrix) -> None:
+    """Process pool initializer; keeps the algo and its distance matrix for the worker's tasks"""
+    global _worker_algo
+    algo.set_distances(distances)
+    _worker_algo = algo
+
+
+def _worker_tour_lengths(num_clusters: int, starts: np.ndarray) -> np.ndarray:
+    """Clustered tour lengths from starts, on the worker's algo"""
+    return _worker_algo._clustered_tour_lengths(starts, _worker_algo.calculate_distances(), num_clusters)
+
+
+def _worker_best_start_for_clusters(num_clusters: int) -> Tuple[float, Coordinate]:
+    """Best start and its route distance for one cluster size, on the worker's algo"""
+    return _worker_algo._best_start_for_clusters(num_clusters)
+
+
 class PathFinderHarness(object):
 
-    def __init__(self, location_path: Path, output_path:Path):
+    def __init__(self, location_path: Path, output_path:Path, cache_distances: bool = True):
         self.location_path = location_path
         self.output_path = output_path
-        self.process = psutil.Process(os.getpid())
-        self.metrics: List[StepMetric] = []
-        #self.algo = PathFinderAlgo(self.location_path)
-
-        start_time = time.time()
-        #self.algo = PathFinderAlgo(self.location_path)
-        self.algo = ClusteredPathFinderAlgo(self.location_path)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Load locations", elapsed, memory_mb)
-
+        # Whether distance matrices are read from and written to DISTANCE_CACHE_DIR
+        self.cache_distances = cache_distances
+
+        # Step metrics are stored column-wise; get_metrics builds StepMetric rows on demand
+        self._metric_names: List[str] = []
+        self._metric_times = np.empty(METRICS_INITIAL_CAPACITY, dtype=np.float64)
+        self._metric_mem = np.empty(METRICS_INITIAL_CAPACITY, dtype=np.float64)
+        self._metric_ts = np.empty(METRICS_INITIAL_CAPACITY, dtype=np.float64)
+
+        # Formatted metric lines, logged in one go by _flush_log
+        self._log_buf: List[str] = []
+
+    @cached_property
+    def algo(self) -> ClusteredPathFinderAlgo:
+        """The path finder, built (and timed as "Load locations") on first use"""
+        with self._step("Load locations"):
+            #return PathFinderAlgo(self.location_path)
+            return ClusteredPathFinderAlgo(self.location_path)
+
+    @cached_property
+    def process(self) -> psutil.Process:
+        return psutil.Process(os.getpid())
+
+    @cached_property
+    def distance_cache_paths(self) -> Tuple[Path, Path]:
+        """
+        Distance matrix cache files, keyed by the location file's contents, the
+        cache format version and the neighbor count.
+        """
+        digest = hashlib.sha1(f"v{DISTANCE_CACHE_VERSION}:k{_neighbor_count(len(self.algo.locations))}:".encode())
+        digest.update(Path(self.location_path).read_bytes())
+        key = digest.hexdigest()[:16]
+        return (DISTANCE_CACHE_DIR / f"{key}.dist.npy",
+                DISTANCE_CACHE_DIR / f"{key}.neighbors.npy")
+
+    @staticmethod
+    def _save_atomic(path: Path, array: np.ndarray) -> None:
+        """np.save to a temporary file and rename it into place, so readers never see a partial file"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as handle:
+                np.save(handle, array)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def _get_memory_usage_mb(self) -> float:
-        """Get current memory usage in MB"""
-        return self.process.memory_info().rss / 1024 / 1024
+        """
+        Get memory usage in MB.
+
+        On Unix this is the process's peak RSS from getrusage, a single libc call
+        rather than a /proc read. ru_maxrss is in KB on Linux and in bytes on
+        macOS. Elsewhere it falls back to psutil's current RSS.
+        """
+        if sys.platform == "win32":
+            return self.process.memory_info().rss / 1024 / 1024
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            return max_rss / 1024 / 1024
+        return max_rss / 1024
+
+    @contextmanager
+    def _step(self, step_name: str):
+        """Times the enclosed block and emits its metrics under step_name"""
+        start_time = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start_time
+        self._emit_step_metrics(step_name, elapsed, self._get_memory_usage_mb())
 
     def _emit_step_metrics(self, step_name: str, elapsed_time: float, memory_mb: float) -> None:
         """Emit timing and memory metrics for a step and store them"""
-        # Create metric object
-        metric = StepMetric(
-            step_name=step_name,
-            elapsed_time=elapsed_time,
-            memory_mb=memory_mb,
-            timestamp=time.time()
-        )
-
-        # Store metric
-        self.metrics.append(metric)
-
-        # Print metric
-        print(f"[METRICS] {step_name}")
-        print(f"  ├─ Time:   {elapsed_time:.3f} seconds")
-        print(f"  └─ Memory: {memory_mb:.2f} MB")
+        i = len(self._metric_names)
+        if i == len(self._metric_times):
+            # Double the columns when full, like list does
+            self._metric_times = np.resize(self._metric_times, 2 * i)
+            self._metric_mem = np.resize(self._metric_mem, 2 * i)
+            self._metric_ts = np.resize(self._metric_ts, 2 * i)
+
+        self._metric_names.append(step_name)
+        self._metric_times[i] = elapsed_time
+        self._metric_mem[i] = memory_mb
+        self._metric_ts[i] = time.time()
+
+        # Buffer the metric; _flush_log logs the whole buffer at the end of the run
+        self._log_buf.append(f"[METRICS] {step_name}\n"
+                             f"  ├─ Time:   {elapsed_time:.3f} seconds\n"
+                             f"  └─ Memory: {memory_mb:.2f} MB\n")
+
+    def _flush_log(self) -> None:
+        """Log buffered metric lines as one DEBUG record"""
+        if self._log_buf:
+            logger.debug("\n" + "".join(self._log_buf).rstrip("\n"))
+        self._log_buf.clear()
 
     def get_metrics(self) -> List[StepMetric]:
         """Return collected metrics"""
-        return self.metrics
+        n = len(self._metric_names)
+        return [
+            StepMetric(step_name=name, elapsed_time=float(elapsed), memory_mb=float(mem), timestamp=float(ts))
+            for name, elapsed, mem, ts in zip(self._metric_names, self._metric_times[:n],
+                                              self._metric_mem[:n], self._metric_ts[:n])
+        ]
+
+    @property
+    def metrics(self) -> List[StepMetric]:
+        return self.get_metrics()
 
     def write_metrics_to_file(self, output_path: Path) -> None:
         """Write metrics to a CSV file"""
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', newline='') as f:
-            writer = csv.writer(f)
+        # Every field is ASCII, so skip the UTF-8 encoder; unix line endings but the
+        # default minimal quoting, as the 'unix' dialect would quote every field
+        with open(output_path, 'w', newline='', encoding='ascii', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator='\n')
             # Write header
             writer.writerow(['step_name', 'elapsed_time_seconds', 'memory_mb', 'timestamp'])
 
-            # Write metrics
-            for metric in self.metrics:
-                writer.writerow([
-                    metric.step_name,
-                    f"{metric.elapsed_time:.6f}",
-                    f"{metric.memory_mb:.2f}",
-                    f"{metric.timestamp:.6f}"
-                ])
+            # Write metrics, formatting each column in one vectorized pass
+            n = len(self._metric_names)
+            writer.writerows(zip(self._metric_names,
+                                 np.char.mod("%.6f", self._metric_times[:n]),
+                                 np.char.mod("%.2f", self._metric_mem[:n]),
+                                 np.char.mod("%.6f", self._metric_ts[:n])))
+
+        logger.info(f"\n✓ Metrics written to: {output_path}")
+
+    def _calculate_distances(self) -> DistanceMatrix:
+        """
+        Returns the algo's distance matrix, memory-mapped from the on-disk cache
+        when this location file has been seen before, and saved to it otherwise.
+
+        An unreadable or mismatched cache entry is recomputed and overwritten.
+        A cache that can't be written is only warned about. With cache_distances
+        off the cache is neither read nor written.
+        """
+        if not self.cache_distances:
+            return self.algo.calculate_distances()
+
+        dist_path, neighbors_path = self.distance_cache_paths
+        if dist_path.exists() and neighbors_path.exists():
+            try:
+                distances = DistanceMatrix(dist=np.load(dist_path, mmap_mode='r'),
+                                           neighbor_idx=np.load(neighbors_path, mmap_mode='r'))
+                # Share it with the algo so its own calculate_distances() calls reuse it
+                self.algo.set_distances(distances)
+                logger.info(f"\nLoaded cached distances from {dist_path}")
+                return distances
+            except (OSError, EOFError, ValueError) as e:
+                logger.warning(f"[WARNING] Ignoring unreadable distance cache {dist_path}: {e}")
+
+        distances = self.algo.calculate_distances()
+        try:
+            DISTANCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._save_atomic(dist_path, distances.dist)
+            self._save_atomic(neighbors_path, distances.neighbor_idx)
+        except OSError as e:
+            logger.warning(f"[WARNING] Couldn't write distance cache {dist_path}: {e}")
+        return distances
+
+    def _validate_and_render(self, route: Route) -> Tuple[bool, str]:
+        """
+        Checks the route on a worker thread while rendering it on this one.
+
+        Neither step depends on the other. Rendering stays on the calling thread
+        since pyplot isn't safe to drive from other threads, and the numpy work
+        in check_route runs alongside it.
+
+        Returns:
+            Whether the route is valid, and the path of the rendered image
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            check = executor.submit(self.algo.check_route, route, False)
+
+            with self._step("Rendered route"):
+                rendered_path = _get_renderer().render_route(route, self.output_path)
+
+            # Only the part of validation not hidden behind the render is timed here
+            with self._step("Validated route"):
+                is_valid = check.result()
 
-        print(f"\n✓ Metrics written to: {output_path}")
+        # Validation is quiet while timed; an invalid route is re-checked to log what's wrong
+        if not is_valid:
+            self.algo.check_route(route, verbose=True)
+
+        return is_valid, rendered_path
 
     def optimize(self) -> None:
         self.algo.optimize_parameters()
+        self._flush_log()
 
     def optimize_starting_point(self) -> Route:
         """
@@ -856,130 +1458,108 @@ class PathFinderHarness(object):
         Returns:
             The optimal route found
         """
-        print(f"\nLoaded {len(self.algo.locations)} locations")
+        logger.info(f"\nLoaded {len(self.algo.locations)} locations")
 
         # Step 2: Calculate distance matrix
-        start_time = time.time()
-        distances = self.algo.calculate_distances()
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Calculate distances", elapsed, memory_mb)
+        with self._step("Calculate distances"):
+            distances = self._calculate_distances()
 
-        print(f"\nCalculated distances for {len(distances)} coordinates")
+        logger.info(f"\nCalculated distances for {len(distances)} coordinates")
 
         # Step 3: Find optimal starting point (this is the key difference)
-        start_time = time.time()
-        best_start = self.algo.find_best_starting_point()
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Find optimal start", elapsed, memory_mb)
+        with self._step("Find optimal start"):
+            best_start = self.algo.find_best_starting_point(distances=distances)
 
-        print(f"\nFound optimal starting point: {best_start}")
+        logger.info(f"\nFound optimal starting point: {best_start}")
 
         # Step 4: Calculate final route with optimal starting point
-        start_time = time.time()
-        route = self.algo.calculate_shortest_path(best_start, distances)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Calculate final route", elapsed, memory_mb)
+        with self._step("Calculate final route"):
+            route = self.algo.calculate_shortest_path(best_start, distances)
 
-        print(f"\nCalculated optimized route with {len(route.steps)} steps")
+        logger.info(f"\nCalculated optimized route with {route.num_steps} steps")
 
-        # Step 5: Check Route
-        start_time = time.time()
-        is_valid = self.algo.check_route(route)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Validated route", elapsed, memory_mb)
+        # Step 4b: Improve route with 2-opt / Or-opt
+        with self._step("Improve route (2-opt/Or-opt)"):
+            route = self.algo.improve_route(route)
 
-        print(f"\nValidated route, is valid: {is_valid}")
+        logger.info(f"\nImproved route to {route.total_distance() / 5280:.2f} miles")
 
-        # Step 6: Render Route
-        start_time = time.time()
-        rendered_path = PathRenderer().render_route(route, self.output_path)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Rendered route", elapsed, memory_mb)
+        # Steps 5-6: Check Route while it renders
+        is_valid, rendered_path = self._validate_and_render(route)
 
-        print(f"\nRoute rendered, saved to: {rendered_path}")
+        logger.info(f"\nValidated route, is valid: {is_valid}")
+        logger.info(f"\nRoute rendered, saved to: {rendered_path}")
 
+        self._flush_log()
         self.write_metrics_to_file(self.output_path / "diags.csv")
-        with open(self.output_path / "route.json","w") as w_handle:
-            json.dump({
-                "start": asdict(route.start),
-                "end": asdict(route.end),
-                "distance": route.total_distance() / 5280.0,
-                "optimized": True
-            }, w_handle, indent=2)
-
-        print("\nFinished (Optimized):")
-        print(f"+ Starting at {route.start}")
-        print(f"+ Making {len(route.steps)} stops")
-        print(f"+ In total, {round(route.total_distance() / 5280.0,2)} miles")
-        print(f"+ Finishing at {route.end}")
+        total_miles = route.total_distance() / 5280.0
+        (self.output_path / "route.json").write_text(json.dumps({
+            "start": {"latitude": route.start.latitude, "longitude": route.start.longitude},
+            "end": {"latitude": route.end.latitude, "longitude": route.end.longitude},
+            "distance": total_miles,
+            "optimized": True
+        }))
+
+        logger.info("\nFinished (Optimized):")
+        logger.info(f"+ Starting at {route.start}")
+        logger.info(f"+ Making {route.num_steps} stops")
+        logger.info(f"+ In total, {round(total_miles, 2)} miles")
+        logger.info(f"+ Finishing at {route.end}")
 
         # Summary
-        print(f"\n{'='*50}")
-        print(f"Optimized path finder completed successfully")
-        print(f"{'='*50}")
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Optimized path finder completed successfully")
+        logger.info(f"{'='*50}")
 
         return route
 
     def run(self) -> Route:
         """Run the path finder algorithm with timing and memory diagnostics"""
 
-          # Step 2: Calculate distance matrix
-        start_time = time.time()
-        distances = self.algo.calculate_distances()
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Calculate distances", elapsed, memory_mb)
+        # Step 1: Load locations (first use of self.algo)
+        logger.info(f"\nLoaded {len(self.algo.locations)} locations")
+
+        # Step 2: Calculate distance matrix
+        with self._step("Calculate distances"):
+            distances = self._calculate_distances()
+
+        logger.info(f"\nCalculated distances for {len(distances)} coordinates")
 
-        print(f"\nCalculated distances for {len(distances)} coordinates")
-        
         # Step 3: Calculate route
-        start_time = time.time()
-        route = self.algo.calculate_shortest_path(self.algo.pick_starting_point(), distances)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Calculate route", elapsed, memory_mb)
-
-        print(f"\nCalculated route with {len(route.steps)} steps")
-
-        # Step 4: Check Route
-        start_time = time.time()
-        is_valid = self.algo.check_route(route)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Validated route", elapsed, memory_mb)
-
-        print(f"\nValidated route, is valid: {is_valid}")
-
-        # Step 5: Render Route
-        start_time = time.time()
-        rendered_path = PathRenderer().render_route(route, self.output_path)
-        elapsed = time.time() - start_time
-        memory_mb = self._get_memory_usage_mb()
-        self._emit_step_metrics("Rendered route", elapsed, memory_mb)
-
-        print(f"\nRoute rendered, saved to: {rendered_path}")
+        with self._step("Calculate route"):
+            route = self.algo.calculate_shortest_path(self.algo.pick_starting_point(), distances)
+
+        logger.info(f"\nCalculated route with {route.num_steps} steps")
+
+        # Step 3b: Improve route with 2-opt / Or-opt
+        with self._step("Improve route (2-opt/Or-opt)"):
+            route = self.algo.improve_route(route)
+
+        logger.info(f"\nImproved route to {route.total_distance() / 5280:.2f} miles")
+
+        # Steps 4-5: Check Route while it renders
+        is_valid, rendered_path = self._validate_and_render(route)
+
+        logger.info(f"\nValidated route, is valid: {is_valid}")
+        logger.info(f"\nRoute rendered, saved to: {rendered_path}")
               
+        self._flush_log()
         self.write_metrics_to_file(self.output_path / "diags.csv")
-        with open(self.output_path / "route.json","w") as w_handle:
-            json.dump({
-                "start": asdict(route.start),
-                "end": asdict(route.end),
-                "distance": route.total_distance() / 5280.0
-            }, w_handle, indent=2)
-
-        print("\nFinished:")
-        print(f"+ Starting at {route.start}")
-        print(f"+ Making {len(route.steps)} stops")
-        print(f"+ In total, {round(route.total_distance() / 5280.0,2)} miles")
-        print(f"+ Finishing at {route.end}")
+        total_miles = route.total_distance() / 5280.0
+        (self.output_path / "route.json").write_text(json.dumps({
+            "start": {"latitude": route.start.latitude, "longitude": route.start.longitude},
+            "end": {"latitude": route.end.latitude, "longitude": route.end.longitude},
+            "distance": total_miles
+        }))
+
+        logger.info("\nFinished:")
+        logger.info(f"+ Starting at {route.start}")
+        logger.info(f"+ Making {route.num_steps} stops")
+        logger.info(f"+ In total, {round(total_miles, 2)} miles")
+        logger.info(f"+ Finishing at {route.end}")
         
         # Summary
-        print(f"\n{'='*50}")
-        print(f"Path finder completed successfully")
-        print(f"{'='*50}")
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Path finder completed successfully")
+        logger.info(f"{'='*50}")
 
@@ -7,6 +7,7 @@ with diagnostic output capabilities.
 """
 
 import click
+import logging
 from pathlib import Path
 import sys
 from path_finder import PathFinderHarness
@@ -31,14 +32,40 @@ from datetime import datetime
     default=False,
     help='Enable or disable starting point optimization (default: disabled)'
 )
-def main(output, locations, optimize):
+@click.option(
+    '--cache-distances/--no-cache-distances',
+    default=True,
+    help='Reuse distance matrices saved in ~/.cache/pathfinder, saving new ones there (default: enabled)'
+)
+@click.option(
+    '-q', '--quiet',
+    is_flag=True,
+    help='Only log warnings and errors from the path finder'
+)
+@click.option(
+    '-v', '--verbose',
+    is_flag=True,
+    help='Also log per-step timing and memory metrics'
+)
+def main(output, locations, optimize, cache_distances, quiet, verbose):
     """
     Path Finder - A tool for path finding analysis
 
     output: Directory where  files will be written
     locations: the locations file for the public restrooms
     optimize: whether to run starting point optimization
+    cache_distances: whether to read and write the on-disk distance matrix cache
+    quiet: only log warnings and errors
+    verbose: also log per-step metrics
     """
+    if quiet and verbose:
+        raise click.UsageError("--quiet and --verbose can't be used together")
+
+    logging.basicConfig(level=logging.WARNING if quiet else logging.INFO, format="%(message)s")
+    if verbose:
+        # Only the path finder's own metrics, not every library's debug output
+        logging.getLogger("pathfinder").setLevel(logging.DEBUG)
+
     # Create output directory if it doesn't exist
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output = output / timestamp
@@ -49,7 +76,7 @@ def main(output, locations, optimize):
     click.echo(f"✓ Output directory: {output}")
     click.echo(f"✓ Starting point optimization: {'enabled' if optimize else 'disabled'}")
 
-    harness = PathFinderHarness(locations, output)
+    harness = PathFinderHarness(locations, output, cache_distances=cache_distances)
     # Pass optimization flag through to the harness run method
     if optimize:
         harness.optimize_starting_point()
@@ -0,0 +1,68 @@
+import pytest
+from pathlib import Path
+import sys
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import core
+from core import addresses_to_fips
+
+
+def batch_response(*lines):
+    """A fake batch geocoder response with the given CSV lines as its body."""
+    response = mock.Mock()
+    response.text = "".join(line + "\n" for line in lines)
+    return response
+
+
+@pytest.fixture
+def addresses():
+    return pd.DataFrame({
+        'street': ["1 Main St", "2 Nowhere Rd", "3 Broadway", "4 Elm St"],
+        'city': ["New York", "New York", "New York", "Brooklyn"],
+        'state': ["NY", "NY", "NY", "NY"],
+    }, index=["a", "b", "c", "d"])
+
+
+class TestAddressesToFips:
+    """Test suite for parsing the Census batch geocoder's responses."""
+
+    def test_matches_are_placed_by_id(self, addresses):
+        """Test that out of order, unmatched and tied rows all land on the right address."""
+        response = batch_response(
+            '"3","4 Elm St, Brooklyn, NY, ","Match","Exact","4 ELM ST, BROOKLYN, NY, 11201",'
+            '"-73.99,40.69","1","L","36","047","000100","1000"',
+            '"1","2 Nowhere Rd, New York, NY, ","No_Match"',
+            '"0","1 Main St, New York, NY, ","Match","Non_Exact","1 MAIN ST, NEW YORK, NY, 10001",'
+            '"-73.99,40.75","2","R","36","061","007600","2000"',
+            '"2","3 Broadway, New York, NY, ","Tie"',
+        )
+        with mock.patch.object(core, "_get_session") as get_session:
+            get_session.return_value.post.return_value = response
+            out = addresses_to_fips(addresses)
+
+        assert out.index.tolist() == ["a", "b", "c", "d"]
+        assert out['street'].tolist() == addresses['street'].tolist()
+        assert out['state_fips'].tolist()[::3] == ["36", "36"]
+        assert out['county_fips'].tolist()[::3] == ["061", "047"]
+        assert out['tract_fips'].tolist()[::3] == ["007600", "000100"]
+        assert out[['state_fips', 'county_fips', 'tract_fips']].iloc[1:3].isna().all().all()
+
+    def test_addresses_are_uploaded_in_chunks(self, addresses, monkeypatch):
+        """Test that each chunk is one upload and ids keep counting across chunks."""
+        monkeypatch.setattr(core, "BATCH_GEOCODE_LIMIT", 3)
+        responses = [
+            batch_response('"1","2 Nowhere Rd","No_Match"', '"0","1 Main St","Match","Exact","x","y","1","L","36","061","1","1"',
+                           '"2","3 Broadway","No_Match"'),
+            batch_response('"3","4 Elm St","Match","Exact","x","y","1","L","36","047","2","1"'),
+        ]
+        with mock.patch.object(core, "_get_session") as get_session:
+            get_session.return_value.post.side_effect = responses
+            out = addresses_to_fips(addresses)
+
+        uploads = [call.kwargs['files']['addressFile'][1].decode() for call in get_session.return_value.post.call_args_list]
+        assert [line.split(",")[0] for upload in uploads for line in upload.splitlines()] == ["0", "1", "2", "3"]
+        assert out['county_fips'].tolist()[::3] == ["061", "047"]
+        assert out['tract_fips'].tolist()[::3] == ["1", "2"]
@@ -0,0 +1,60 @@
+import pytest
+from pathlib import Path
+import sys
+
+from click.testing import CliRunner
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from norm_daily_tasks import normalize
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    """Daily task files that repeat rows, quote cells and disagree on column order."""
+    files = {
+        "first.csv": 'id,date_worked,task\n'
+                     '1,1/1/2021,"x, y"\n'
+                     '1,1/1/2021,"x, y"\n'
+                     '2,2/2/2021,"q""z"\n'
+                     '\n'
+                     '3,3/3/2022,a\n',
+        "reordered.csv": 'date_worked,task,id\n'
+                         '1/1/2021,"x, y",1\n'
+                         '4/4/2022,b,4\n',
+        "missing_task.csv": 'id,date_worked\n'
+                            '5,5/5/2022\n',
+    }
+    for name, text in files.items():
+        (tmp_path / name).write_text(text)
+    return [str(tmp_path / name) for name in files]
+
+
+def run_normalize(input_files, output_dir, engine):
+    result = CliRunner().invoke(normalize, [*input_files, "-o", str(output_dir), "--engine", engine])
+    assert result.exit_code == 0, result.output
+    return {path.name: path.read_bytes() for path in sorted(Path(output_dir).iterdir())}
+
+
+class TestNormDailyTasks:
+    """Test suite for partitioning and deduplicating daily task files."""
+
+    def test_engines_write_identical_partitions(self, input_files, tmp_path):
+        """Test that the arrow and python engines write byte-identical files."""
+        arrow = run_normalize(input_files, tmp_path / "arrow", "arrow")
+        python = run_normalize(input_files, tmp_path / "python", "python")
+
+        assert arrow == python
+        assert python == {
+            "2021.csv": b'id,date_worked,task\r\n1,1/1/2021,"x, y"\r\n2,2/2/2021,"q""z"\r\n',
+            "2022.csv": b'id,date_worked,task\r\n3,3/3/2022,a\r\n4,4/4/2022,b\r\n5,5/5/2022,\r\n',
+        }
+
+    @pytest.mark.parametrize("engine", ["arrow", "python"])
+    def test_unknown_column_is_an_error(self, input_files, tmp_path, engine):
+        """Test that a column the partition header has no place for is refused."""
+        extra = tmp_path / "extra.csv"
+        extra.write_text("id,date_worked,task,note\n6,6/6/2021,c,late\n")
+
+        result = CliRunner().invoke(normalize, [input_files[0], str(extra), "-o", str(tmp_path / "out"),
+                                                "--engine", engine])
+        assert isinstance(result.exception, ValueError)
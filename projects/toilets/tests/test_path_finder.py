@@ -0,0 +1,291 @@
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+import tempfile
+import shutil
+
+# Import path_finder the way the CLI and notebooks do. Numba's on-disk kernel cache
+# records the module name, so importing it as src.path_finder here would break them
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import path_finder
+from path_finder import (
+    DEFAULT_NUM_CLUSTERS,
+    ClusteredPathFinderAlgo,
+    DistanceMatrix,
+    STATEN_ISLAND_ID,
+    PathFinderAlgo,
+    PathFinderHarness,
+    Route,
+    _greedy_nn,
+    _or_opt,
+    _two_opt,
+    check_route_fast,
+)
+
+
+def staten_island_crossings(algo, route):
+    """Number of legs in the route between Staten Island and another borough."""
+    is_staten_island = algo._staten_island_mask()[route.path_idx]
+    return int(np.count_nonzero(is_staten_island[1:] != is_staten_island[:-1]))
+
+
+def assert_visits_every_location_once(algo, route):
+    assert sorted(route.path_idx.tolist()) == list(range(len(algo.locations)))
+
+
+def reference_greedy_walk(algo, distances, start):
+    """The greedy Staten Island constrained walk, scanning whole sorted distance rows."""
+    is_staten_island = algo._staten_island_mask()
+    visited = {start}
+    path = [start]
+    while len(path) < len(algo.locations):
+        current = path[-1]
+        staten_island_only = is_staten_island[current] and not all(
+            i in visited for i in np.flatnonzero(is_staten_island))
+        path.append(next(int(k) for k in np.argsort(distances.dist[current], kind="stable")
+                         if k not in visited and (not staten_island_only or is_staten_island[k])))
+        visited.add(path[-1])
+    return path
+
+
+def write_location_file(directory, num_staten_island, num_elsewhere, seed):
+    """Writes random points in Staten Island and the rest of NYC to a location file."""
+    rng = np.random.default_rng(seed)
+    staten_island = np.column_stack([rng.uniform(40.52, 40.62, num_staten_island),
+                                     rng.uniform(-74.22, -74.08, num_staten_island)])
+    elsewhere = np.column_stack([rng.uniform(40.58, 40.86, num_elsewhere),
+                                 rng.uniform(-74.00, -73.78, num_elsewhere)])
+
+    location_path = Path(directory) / "locations.csv"
+    with open(location_path, "w") as handle:
+        handle.write("Name,Latitude,Longitude\n")
+        for i, (lat, lon) in enumerate(np.concatenate([staten_island, elsewhere])):
+            handle.write(f"p{i},{lat:.6f},{lon:.6f}\n")
+    return location_path
+
+
+@pytest.fixture(scope="module")
+def location_path():
+    """A location file with random points in Staten Island and the rest of NYC."""
+    temp_dir = tempfile.mkdtemp()
+    yield write_location_file(temp_dir, 15, 45, seed=7)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture(scope="module")
+def large_location_path():
+    """Like location_path, but with more locations than nearest neighbors kept per location."""
+    temp_dir = tempfile.mkdtemp()
+    yield write_location_file(temp_dir, 60, 240, seed=13)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture(scope="module")
+def algo(location_path):
+    return PathFinderAlgo(location_path)
+
+
+@pytest.fixture(scope="module")
+def clustered_algo(location_path):
+    return ClusteredPathFinderAlgo(location_path)
+
+
+class TestPathFinder:
+    """Test suite for the path finder route construction and improvement."""
+
+    @pytest.fixture(params=["greedy", "clustered"])
+    def any_algo(self, request, algo, clustered_algo):
+        return algo if request.param == "greedy" else clustered_algo
+
+    def test_route_visits_every_location_once(self, any_algo):
+        """Test that routes from every start visit each location exactly once."""
+        distances = any_algo.calculate_distances()
+        for start in any_algo.locations[::7]:
+            route = any_algo.calculate_shortest_path(start, distances)
+
+            assert_visits_every_location_once(any_algo, route)
+            assert route.start == start
+            assert any_algo.check_route(route, verbose=False)
+
+    def test_greedy_route_visits_staten_island_in_one_stretch(self, algo):
+        """Test that the greedy route never leaves Staten Island before finishing it."""
+        distances = algo.calculate_distances()
+        for start in algo.locations[::7]:
+            route = algo.calculate_shortest_path(start, distances)
+            assert staten_island_crossings(algo, route) <= 2
+
+    def test_improve_route(self, any_algo):
+        """Test that improve_route keeps the stops and endpoints and never lengthens the route."""
+        distances = any_algo.calculate_distances()
+        for start in any_algo.locations[::7]:
+            route = any_algo.calculate_shortest_path(start, distances)
+            improved = any_algo.improve_route(route)
+
+            assert_visits_every_location_once(any_algo, improved)
+            assert improved.start == route.start
+            assert improved.end == route.end
+            assert improved.total_distance() <= route.total_distance() + 1e-6
+            assert staten_island_crossings(any_algo, improved) <= staten_island_crossings(any_algo, route)
+
+    @pytest.mark.parametrize("local_search", [_two_opt, _or_opt])
+    def test_local_search_on_random_paths(self, algo, local_search):
+        """Test each local search kernel on its own, from random (bad) starting paths."""
+        distances = algo.calculate_distances()
+        is_staten_island = algo._staten_island_mask()
+        rng = np.random.default_rng(11)
+        for _ in range(5):
+            path = rng.permutation(len(algo.locations)).astype(np.int32)
+            route = Route(locations=algo.locations, path_idx=path, dist=distances.dist)
+            improved = Route(locations=algo.locations,
+                             path_idx=local_search(path, distances.dist, is_staten_island),
+                             dist=distances.dist)
+
+            assert_visits_every_location_once(algo, improved)
+            assert improved.path_idx[0] == path[0]
+            assert improved.path_idx[-1] == path[-1]
+            assert improved.total_distance() < route.total_distance()
+            assert staten_island_crossings(algo, improved) <= staten_island_crossings(algo, route)
+
+    def test_best_start_matches_exhaustive_search(self, algo):
+        """Test that the parallel, pruned start search finds the shortest greedy route."""
+        distances = algo.calculate_distances()
+        best_start = algo.find_best_starting_point(distances)
+
+        exhaustive = min(algo.calculate_shortest_path(start, distances).total_distance()
+                         for start in algo.locations)
+        found = algo.calculate_shortest_path(best_start, distances).total_distance()
+        assert found == pytest.approx(exhaustive)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_clustered_best_start_matches_exhaustive_search(self, clustered_algo, max_workers):
+        """Test that the clustered algo scores starts with the clustered route it builds, in or out of process."""
+        distances = clustered_algo.calculate_distances()
+        best_start = clustered_algo.find_best_starting_point(distances, max_workers=max_workers)
+
+        params = {"num_clusters": DEFAULT_NUM_CLUSTERS}
+        exhaustive = min(clustered_algo.calculate_shortest_path(start, distances, params).total_distance()
+                         for start in clustered_algo.locations)
+        found = clustered_algo.calculate_shortest_path(best_start, distances).total_distance()
+        assert found == pytest.approx(exhaustive)
+
+    def test_optimize_parameters_matches_in_process_search(self, clustered_algo):
+        """Test that the worker-pool cluster size search returns the best in-process result."""
+        best_start = clustered_algo.optimize_parameters(max_clusters=4)
+
+        expected = min((clustered_algo._best_start_for_clusters(n) for n in range(1, 4)), key=lambda r: r[0])
+        assert best_start == expected[1]
+
+    def test_greedy_walk_past_kept_neighbors_matches_full_scan(self, large_location_path):
+        """Test that the greedy walk still picks the nearest location once its kept neighbors are used up."""
+        algo = PathFinderAlgo(large_location_path)
+        distances = algo.calculate_distances()
+        assert distances.neighbor_idx.shape[1] < len(algo.locations)
+
+        for start in range(0, len(algo.locations), 37):
+            path = _greedy_nn(distances.neighbor_idx, distances.dist, start, algo._borough_id, STATEN_ISLAND_ID)
+            reference = reference_greedy_walk(algo, distances, start)
+            assert path.tolist() == reference
+
+            # The walk left the kept neighbors at least once, so the full-row scan was exercised
+            assert any(b not in distances.neighbor_idx[a] for a, b in zip(reference, reference[1:]))
+
+    def test_clustered_nearest_point_past_kept_neighbors(self, large_location_path):
+        """Test that the clustered walk's nearest point lookup scans the full row when no kept neighbor qualifies."""
+        algo = ClusteredPathFinderAlgo(large_location_path)
+        distances = algo.calculate_distances()
+        rng = np.random.default_rng(3)
+
+        for point in range(0, len(algo.locations), 23):
+            candidates = np.ones(len(algo.locations), dtype=bool)
+            candidates[distances.neighbor_idx[point]] = False
+            candidates &= rng.random(len(algo.locations)) < 0.2
+
+            expected = int(np.argmin(np.where(candidates, distances.dist[point], np.inf)))
+            assert algo._find_nearest_point(point, candidates, distances) == expected
+
+        assert algo._find_nearest_point(0, np.zeros(len(algo.locations), dtype=bool), distances) == -1
+
+        route = algo.calculate_shortest_path(algo.locations[0], distances)
+        assert_visits_every_location_once(algo, route)
+
+    def test_check_route_fast_reports_problems(self):
+        """Test that duplicates, missing and out of range indices are all reported."""
+        is_valid, diagnostics = check_route_fast(np.array([0, 1, 1, 7]), 4)
+
+        assert not is_valid
+        assert diagnostics["duplicates"].tolist() == [1]
+        assert diagnostics["duplicate_counts"].tolist() == [2]
+        assert diagnostics["missing"].tolist() == [2, 3]
+        assert diagnostics["extra"].tolist() == [7]
+
+        assert check_route_fast(np.array([2, 0, 3, 1]), 4)[0]
+
+    def test_set_distances_rejects_mismatched_matrix(self, location_path):
+        """Test that a precomputed matrix for a different location set is refused."""
+        algo = PathFinderAlgo(location_path)
+        num_locations = len(algo.locations)
+        distances = DistanceMatrix(dist=np.zeros((num_locations - 1, num_locations - 1), dtype=np.float32),
+                                   neighbor_idx=np.zeros((num_locations - 1, 1), dtype=np.int32))
+
+        with pytest.raises(ValueError):
+            algo.set_distances(distances)
+
+
+class TestDistanceCache:
+    """Test suite for the harness's on-disk distance matrix cache."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(path_finder, "DISTANCE_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    def harness(self, location_path, tmp_path, **kwargs):
+        return PathFinderHarness(location_path, tmp_path / "out", **kwargs)
+
+    def test_second_run_loads_the_cached_matrix(self, location_path, tmp_path, cache_dir):
+        """Test that a matrix written by one harness is memory-mapped by the next."""
+        computed = self.harness(location_path, tmp_path)._calculate_distances()
+        assert len(list(cache_dir.glob("*.npy"))) == 2
+
+        harness = self.harness(location_path, tmp_path)
+        loaded = harness._calculate_distances()
+
+        assert isinstance(loaded.dist, np.memmap)
+        assert np.array_equal(loaded.dist, computed.dist)
+        assert np.array_equal(loaded.neighbor_idx, computed.neighbor_idx)
+        assert harness.algo.calculate_distances() is loaded
+
+    def test_mismatched_cache_entry_is_recomputed(self, location_path, tmp_path, cache_dir):
+        """Test that a cache entry of the wrong shape is recomputed and overwritten."""
+        harness = self.harness(location_path, tmp_path)
+        dist_path, neighbors_path = harness.distance_cache_paths
+        cache_dir.mkdir()
+        np.save(dist_path, np.zeros((2, 2), dtype=np.float32))
+        np.save(neighbors_path, np.zeros((2, 1), dtype=np.int32))
+
+        distances = harness._calculate_distances()
+
+        num_locations = len(harness.algo.locations)
+        assert distances.dist.shape == (num_locations, num_locations)
+        assert np.load(dist_path).shape == (num_locations, num_locations)
+
+    def test_cache_disabled_neither_reads_nor_writes(self, location_path, tmp_path, cache_dir):
+        """Test that cache_distances=False (--no-cache-distances) leaves the cache alone."""
+        distances = self.harness(location_path, tmp_path, cache_distances=False)._calculate_distances()
+
+        assert distances.dist.shape[0] == distances.neighbor_idx.shape[0]
+        assert not cache_dir.exists()
+
+    def test_unwritable_cache_still_returns_the_matrix(self, location_path, tmp_path, monkeypatch, caplog):
+        """Test that a cache directory that can't be created only logs a warning."""
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        monkeypatch.setattr(path_finder, "DISTANCE_CACHE_DIR", blocker / "cache")
+
+        harness = self.harness(location_path, tmp_path)
+        distances = harness._calculate_distances()
+
+        assert distances.dist.shape == (len(harness.algo.locations), len(harness.algo.locations))
+        assert "Couldn't write distance cache" in caplog.text